@@ -3,6 +3,7 @@
 import sys
 import os
 import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from PySide6.QtCore import QMetaObject, Qt, Q_ARG, Signal, QTimer, Slot
 
@@ -43,6 +44,8 @@ class PicACGAdapter(BaseSourceAdapter):
     UUID = "defaultUuid"
     UPDATE_VERSION = "v1.5.3"
     
+    CHAPTERS_CACHE_MAX = 128  # comics whose chapter lists are kept in memory
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the PicACG adapter.
@@ -65,6 +68,10 @@ class PicACGAdapter(BaseSourceAdapter):
         self._speed_test_timer = QTimer()
         self._speed_test_timer.timeout.connect(self._on_speed_test_timeout)
         
+        # Chapter lists by comic id, filled by worker threads
+        self._chapters_cache: "OrderedDict[str, List[Chapter]]" = OrderedDict()
+        self._chapters_cache_lock = threading.Lock()
+        
         # 初始化默认的API端点和图片服务器列表
         self._api_endpoints = [
             'https://picaapi.picacomic.com',
@@ -798,6 +805,16 @@ class PicACGAdapter(BaseSourceAdapter):
             self.chapters_failed.emit("Adapter not initialized")
             return
         
+        with self._chapters_cache_lock:
+            cached = self._chapters_cache.get(comic_id)
+            if cached is not None:
+                self._chapters_cache.move_to_end(comic_id)
+        
+        if cached is not None:
+            # Still asynchronous for the caller, just without the HTTP request
+            QTimer.singleShot(0, lambda: self.chapters_completed.emit(cached))
+            return
+        
         # Use thread pool to avoid blocking UI
         def chapters_worker():
             try:
@@ -910,6 +927,11 @@ class PicACGAdapter(BaseSourceAdapter):
                                 continue
                     
                     print(f"✅ 成功获取 {len(chapters)} 个章节")
+                    with self._chapters_cache_lock:
+                        self._chapters_cache[comic_id] = chapters
+                        self._chapters_cache.move_to_end(comic_id)
+                        if len(self._chapters_cache) > self.CHAPTERS_CACHE_MAX:
+                            self._chapters_cache.popitem(last=False)
                     self.chapters_completed.emit(chapters)
                     return
                     
@@ -6,6 +6,7 @@ from typing import Optional
 
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmapCache
 
 from pancomic.core.config_manager import ConfigManager
 from pancomic.core.logger import Logger
@@ -104,6 +105,9 @@ class Application:
             self.qt_app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
             self.qt_app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
             
+            # Decoded covers/thumbnails of all pages share the process-wide pixmap cache (KB)
+            QPixmapCache.setCacheLimit(100 * 1024)
+            
             # Initialize logger
             log_dir = self.app_data_dir / 'logs'
             Logger.setup(
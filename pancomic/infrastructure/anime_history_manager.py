@@ -1,10 +1,17 @@
 """Anime history manager for storing saved anime and local videos."""
 
 import json
+import os
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    # Fallback to stdlib json
+    orjson = None
+
 from pancomic.models.anime import Anime
 
 
@@ -25,24 +32,33 @@ class AnimeHistoryManager:
         """
         if storage_path is None:
             # Default to project_root/downloads/anime_history.json
-            from pathlib import Path
             project_root = Path(__file__).parent.parent.parent  # Go up to project root
             storage_path = str(project_root / "downloads" / "anime_history.json")
         
         self.storage_path = Path(storage_path)
         self.downloads_path = self.storage_path.parent / "anime"
         self._history: List[Anime] = []
+        self._last_mtime_ns: Optional[int] = None
         self._load()
     
+    def _get_mtime_ns(self) -> Optional[int]:
+        """Get modification time of the storage file, or None if missing."""
+        try:
+            return os.stat(self.storage_path).st_mtime_ns
+        except OSError:
+            return None
+    
     def _load(self) -> None:
         """Load history from file."""
-        if not self.storage_path.exists():
+        self._last_mtime_ns = self._get_mtime_ns()
+        if self._last_mtime_ns is None:
             self._history = []
             return
         
         try:
-            with open(self.storage_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.storage_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
             self._history = [Anime.from_dict(item) for item in data]
         except (json.JSONDecodeError, ValueError, KeyError) as e:
@@ -58,6 +74,8 @@ class AnimeHistoryManager:
             data = [anime.to_dict() for anime in self._history]
             with open(self.storage_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            # In-memory state already matches what was written
+            self._last_mtime_ns = self._get_mtime_ns()
         except Exception as e:
             print(f"Error saving anime history: {e}")
     
@@ -227,6 +245,18 @@ class AnimeHistoryManager:
         """Reload history from file (useful when another instance modified the file)."""
         self._load()
     
+    def reload_if_changed(self) -> bool:
+        """
+        Reload history only if the file changed since the last load/save.
+        
+        Returns:
+            True if the history was reloaded
+        """
+        if self._get_mtime_ns() == self._last_mtime_ns:
+            return False
+        self._load()
+        return True
+    
     def get_by_id(self, anime_id: str, source: str = None) -> Optional[Anime]:
         """
         Get anime by ID.
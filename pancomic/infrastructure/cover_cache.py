@@ -0,0 +1,192 @@
+"""Persistent cover image cache for PanComic application."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class CoverCache:
+    """
+    SQLite-backed disk cache for downloaded cover/thumbnail bytes.
+    
+    Stores the encoded image bytes keyed by URL hash and evicts the least
+    recently used entries once the total size exceeds the limit. Cache hits
+    only record their access time in memory; the times are written in
+    batches, so reads never wait for a disk sync. Safe to use from worker
+    threads.
+    """
+    
+    # Pending access times written once this many cache hits have piled up
+    TOUCH_FLUSH_THRESHOLD = 64
+    
+    def __init__(self, db_path: str, max_size_mb: int = 50):
+        """
+        Initialize CoverCache.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            max_size_mb: Maximum total size of cached images in megabytes
+        """
+        self.db_path = Path(db_path)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        
+        self._lock = threading.Lock()
+        self._pending_touches: Dict[str, int] = {}  # url_sha1 -> atime not yet written
+        
+        # Ensure parent directory exists
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.connection = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False  # Allow multi-threaded access
+        )
+        # WAL lets reads proceed during writes; NORMAL skips the fsync per commit
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS covers (
+                url_sha1 TEXT PRIMARY KEY,
+                bytes BLOB NOT NULL,
+                atime INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            )
+        ''')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS idx_covers_atime ON covers(atime)')
+        self.connection.commit()
+        
+        self.current_size_bytes, self._last_atime = self.connection.execute(
+            'SELECT COALESCE(SUM(size), 0), COALESCE(MAX(atime), 0) FROM covers'
+        ).fetchone()
+    
+    def _next_atime(self) -> int:
+        """
+        Get a strictly increasing access timestamp.
+        
+        The system clock can be coarse (~15 ms on Windows), so ties are
+        broken by bumping the previous value.
+        
+        This method should be called while holding _lock.
+        """
+        self._last_atime = max(time.time_ns(), self._last_atime + 1)
+        return self._last_atime
+    
+    @staticmethod
+    def _url_key(url: str) -> str:
+        """Hash a URL into the cache key."""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+    
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Get cached image bytes by URL.
+        
+        Args:
+            url: Image URL
+        
+        Returns:
+            Encoded image bytes if cached, None otherwise
+        """
+        if not url or self.connection is None:
+            return None
+        
+        key = self._url_key(url)
+        with self._lock:
+            try:
+                row = self.connection.execute(
+                    'SELECT bytes FROM covers WHERE url_sha1 = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                self._pending_touches[key] = self._next_atime()
+                if len(self._pending_touches) >= self.TOUCH_FLUSH_THRESHOLD:
+                    self._flush_touches()
+                    self.connection.commit()
+                return bytes(row[0])
+            except sqlite3.Error:
+                return None
+    
+    def put(self, url: str, data: bytes) -> None:
+        """
+        Cache image bytes, evicting least recently used entries if needed.
+        
+        Args:
+            url: Image URL (used as cache key)
+            data: Encoded image bytes
+        """
+        if not url or not data or self.connection is None:
+            return
+        
+        key = self._url_key(url)
+        with self._lock:
+            try:
+                old = self.connection.execute(
+                    'SELECT size FROM covers WHERE url_sha1 = ?', (key,)
+                ).fetchone()
+                if old is not None:
+                    self.current_size_bytes -= old[0]
+                
+                # Eviction below must see the latest access times
+                self._pending_touches.pop(key, None)
+                self._flush_touches()
+                
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO covers (url_sha1, bytes, atime, size) VALUES (?, ?, ?, ?)',
+                    (key, sqlite3.Binary(data), self._next_atime(), len(data))
+                )
+                self.current_size_bytes += len(data)
+                
+                self._evict_if_needed()
+                self.connection.commit()
+            except sqlite3.Error:
+                self.connection.rollback()
+                self.current_size_bytes = self.connection.execute(
+                    'SELECT COALESCE(SUM(size), 0) FROM covers'
+                ).fetchone()[0]
+    
+    def _flush_touches(self) -> None:
+        """
+        Write the access times recorded by cache hits, without committing.
+        
+        This method should be called while holding _lock.
+        """
+        if not self._pending_touches:
+            return
+        
+        touches = [(atime, key) for key, atime in self._pending_touches.items()]
+        self._pending_touches.clear()
+        self.connection.executemany('UPDATE covers SET atime = ? WHERE url_sha1 = ?', touches)
+    
+    def _evict_if_needed(self) -> None:
+        """
+        Delete least recently used entries until the cache fits its limit.
+        
+        This method should be called while holding _lock.
+        """
+        if self.current_size_bytes <= self.max_size_bytes:
+            return
+        
+        victims = []
+        excess = self.current_size_bytes - self.max_size_bytes
+        for key, size in self.connection.execute('SELECT url_sha1, size FROM covers ORDER BY atime'):
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+            self.current_size_bytes -= size
+        
+        self.connection.executemany('DELETE FROM covers WHERE url_sha1 = ?', victims)
+    
+    def close(self) -> None:
+        """Close database connection."""
+        with self._lock:
+            if self.connection:
+                try:
+                    self._flush_touches()
+                    self.connection.commit()
+                except sqlite3.Error:
+                    pass
+                self.connection.close()
+                self.connection = None
@@ -28,7 +28,7 @@ class PicACGWrapper(QObject):
     # Signals for UI integration
     login_completed = Signal(bool, str)  # success, message
     login_failed = Signal(str)  # error message
-    search_completed = Signal(list)  # comics list
+    search_completed = Signal(list, int)  # comics list, total pages
     search_failed = Signal(str)  # error message
     chapters_completed = Signal(list)  # chapters list
     chapters_failed = Signal(str)  # error message
@@ -360,7 +360,9 @@ class PicACGWrapper(QObject):
                     # Parse response using original PicACG-qt response handling
                     if task.res and task.res.code == 200:
                         try:
-                            comics_data = task.res.data.get("comics", {}).get("docs", [])
+                            comics_page = task.res.data.get("comics", {})
+                            comics_data = comics_page.get("docs", [])
+                            total_pages = max(1, int(comics_page.get("pages", 1) or 1))
                             
                             for pica_comic in comics_data:
                                 try:
@@ -393,7 +395,7 @@ class PicACGWrapper(QObject):
                                     print(f"❌ 处理漫画时出错: {comic_error}")
                                     continue
                             
-                            self.search_completed.emit(comics)
+                            self.search_completed.emit(comics, total_pages)
                             print(f"✅ 搜索完成: 找到 {len(comics)} 个结果")
                             print(f"   使用端点: {endpoint}")
                             return
@@ -720,45 +722,15 @@ class PicACGWrapper(QObject):
         self._thread_pool.submit(test_worker)
     
     def _do_test_endpoints(self) -> None:
-        """Internal endpoint testing method."""
+        """Internal endpoint testing method (all endpoints probed concurrently)."""
         try:
-            import requests
             import urllib3
             
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
             
-            results = {}
-            
-            for endpoint in self._api_endpoints:
-                try:
-                    start_time = time_module.time()
-                    
-                    headers = {
-                        'User-Agent': 'okhttp/3.8.1',
-                        'Accept': 'application/vnd.picacomic.com.v1+json',
-                    }
-                    
-                    # Handle IP endpoints with Host header
-                    if endpoint.startswith('https://104.21.91.145') or endpoint.startswith('https://188.114.98.153'):
-                        headers['Host'] = 'picaapi.picacomic.com'
-                    
-                    response = requests.get(
-                        f"{endpoint}/",
-                        headers=headers,
-                        timeout=10,
-                        verify=False
-                    )
-                    
-                    elapsed = time_module.time() - start_time
-                    
-                    if response.status_code < 500:
-                        results[endpoint] = elapsed * 1000  # Convert to ms
-                    else:
-                        results[endpoint] = -1
-                        
-                except Exception as e:
-                    results[endpoint] = -1
-                    print(f"❌ 测试端点 {endpoint} 失败: {e}")
+            endpoints = list(self._api_endpoints)
+            with ThreadPoolExecutor(max_workers=len(endpoints) or 1) as executor:
+                results = dict(zip(endpoints, executor.map(self._test_endpoint, endpoints)))
             
             self.endpoint_test_completed.emit(results)
             print(f"✅ 端点测试完成: {results}")
@@ -766,6 +738,44 @@ class PicACGWrapper(QObject):
         except Exception as e:
             print(f"❌ 端点测试异常: {e}")
     
+    def _test_endpoint(self, endpoint: str) -> float:
+        """
+        Measure response time of a single API endpoint.
+        
+        Returns:
+            Response time in ms, or -1 if unreachable
+        """
+        import requests
+        
+        try:
+            start_time = time_module.perf_counter()
+            
+            headers = {
+                'User-Agent': 'okhttp/3.8.1',
+                'Accept': 'application/vnd.picacomic.com.v1+json',
+            }
+            
+            # Handle IP endpoints with Host header
+            if endpoint.startswith('https://104.21.91.145') or endpoint.startswith('https://188.114.98.153'):
+                headers['Host'] = 'picaapi.picacomic.com'
+            
+            response = requests.get(
+                f"{endpoint}/",
+                headers=headers,
+                timeout=10,
+                verify=False
+            )
+            
+            elapsed = time_module.perf_counter() - start_time
+            
+            if response.status_code < 500:
+                return elapsed * 1000  # Convert to ms
+            return -1
+            
+        except Exception as e:
+            print(f"❌ 测试端点 {endpoint} 失败: {e}")
+            return -1
+    
     def test_image_servers(self) -> None:
         """Test image servers speed."""
         def test_worker():
@@ -777,51 +787,15 @@ class PicACGWrapper(QObject):
         self._thread_pool.submit(test_worker)
     
     def _do_test_image_servers(self) -> None:
-        """Internal image server testing method."""
+        """Internal image server testing method (all servers probed concurrently)."""
         try:
-            import requests
             import urllib3
             
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
             
-            results = {}
-            
-            for server in self._image_servers:
-                try:
-                    start_time = time_module.time()
-                    
-                    test_urls = [
-                        f"https://{server}/static/tobeimg/logo.png",
-                        f"https://{server}/favicon.ico",
-                        f"https://{server}/",
-                    ]
-                    
-                    success = False
-                    for test_url in test_urls:
-                        try:
-                            response = requests.get(
-                                test_url,
-                                timeout=10,
-                                headers={'User-Agent': 'okhttp/3.8.1'},
-                                verify=False
-                            )
-                            
-                            if response.status_code < 400:
-                                success = True
-                                break
-                        except:
-                            continue
-                    
-                    elapsed = time_module.time() - start_time
-                    
-                    if success:
-                        results[server] = elapsed * 1000  # Convert to ms
-                    else:
-                        results[server] = -1
-                        
-                except Exception as e:
-                    results[server] = -1
-                    print(f"❌ 测试图片服务器 {server} 失败: {e}")
+            servers = list(self._image_servers)
+            with ThreadPoolExecutor(max_workers=len(servers) or 1) as executor:
+                results = dict(zip(servers, executor.map(self._test_image_server, servers)))
             
             self.image_server_test_completed.emit(results)
             print(f"✅ 图片服务器测试完成: {results}")
@@ -829,6 +803,39 @@ class PicACGWrapper(QObject):
         except Exception as e:
             print(f"❌ 图片服务器测试异常: {e}")
     
+    def _test_image_server(self, server: str) -> float:
+        """
+        Measure response time of a single image server.
+        
+        Returns:
+            Response time in ms, or -1 if unreachable
+        """
+        import requests
+        
+        start_time = time_module.perf_counter()
+        
+        test_urls = [
+            f"https://{server}/static/tobeimg/logo.png",
+            f"https://{server}/favicon.ico",
+            f"https://{server}/",
+        ]
+        
+        for test_url in test_urls:
+            try:
+                response = requests.get(
+                    test_url,
+                    timeout=10,
+                    headers={'User-Agent': 'okhttp/3.8.1'},
+                    verify=False
+                )
+                
+                if response.status_code < 400:
+                    return (time_module.perf_counter() - start_time) * 1000  # Convert to ms
+            except Exception:
+                continue
+        
+        return -1
+    
     def auto_login(self) -> None:
         """Attempt auto-login with stored credentials."""
         auto_login_enabled = self.config.get('auto_login', False)
@@ -1,7 +1,10 @@
 """Unit tests for adapters."""
 
 import unittest
+from unittest import mock
+from PySide6.QtWidgets import QApplication
 from pancomic.adapters import BaseSourceAdapter, JMComicAdapter, PicACGAdapter
+from pancomic.models.chapter import Chapter
 
 
 class TestBaseSourceAdapter(unittest.TestCase):
@@ -117,6 +120,25 @@ class TestPicACGAdapter(unittest.TestCase):
         """Test PicACG-specific signals."""
         self.assertTrue(hasattr(self.adapter, 'endpoint_test_completed'))
         self.assertTrue(hasattr(self.adapter, 'endpoint_changed'))
+    
+    def test_get_chapters_served_from_cache(self):
+        """Test that a cached chapter list is emitted without a new request."""
+        app = QApplication.instance() or QApplication([])
+        chapter = Chapter(
+            id="1", comic_id="comic1", title="第1话", chapter_number=1, page_count=0,
+            is_downloaded=False, download_path=None, source="picacg"
+        )
+        self.adapter._is_initialized = True
+        self.adapter._chapters_cache["comic1"] = [chapter]
+        
+        received = []
+        self.adapter.chapters_completed.connect(received.append)
+        with mock.patch.object(self.adapter, '_thread_pool') as pool:
+            self.adapter.get_chapters("comic1")
+            app.processEvents()
+        
+        pool.submit.assert_not_called()
+        self.assertEqual(received, [[chapter]])
 
 
 if __name__ == '__main__':
@@ -1 +1,82 @@
 """Unit tests for image cache."""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from pancomic.infrastructure.cover_cache import CoverCache
+
+
+class TestCoverCache(unittest.TestCase):
+    """Test CoverCache functionality."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / "covers.sqlite"
+        self.cache = CoverCache(str(self.db_path))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_put_and_get(self):
+        """Test storing and retrieving image bytes, also across reopen."""
+        self.cache.put("http://example.com/a.jpg", b"image-a")
+        
+        self.assertEqual(self.cache.get("http://example.com/a.jpg"), b"image-a")
+        self.assertIsNone(self.cache.get("http://example.com/missing.jpg"))
+        
+        self.cache.close()
+        self.cache = CoverCache(str(self.db_path))
+        self.assertEqual(self.cache.get("http://example.com/a.jpg"), b"image-a")
+        self.assertEqual(self.cache.current_size_bytes, len(b"image-a"))
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first."""
+        self.cache.max_size_bytes = 25
+        self.cache.put("a", b"x" * 10)
+        self.cache.put("b", b"y" * 10)
+        
+        # Touch "a" so "b" becomes the oldest entry
+        self.cache.get("a")
+        self.cache.put("c", b"z" * 10)
+        
+        self.assertEqual(self.cache.get("a"), b"x" * 10)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("c"), b"z" * 10)
+        self.assertEqual(self.cache.current_size_bytes, 20)
+
+    
+    def test_hits_do_not_write(self):
+        """Test that a cache hit leaves no open write transaction behind."""
+        self.cache.put("a", b"x" * 10)
+        
+        self.assertEqual(self.cache.get("a"), b"x" * 10)
+        self.assertFalse(self.cache.connection.in_transaction)
+        self.assertEqual(len(self.cache._pending_touches), 1)
+    
+    def test_access_times_survive_reopen(self):
+        """Test that access times recorded in memory are written on close."""
+        self.cache.put("a", b"x" * 10)
+        self.cache.put("b", b"y" * 10)
+        self.cache.get("a")
+        
+        self.cache.close()
+        self.cache = CoverCache(str(self.db_path))
+        self.cache.max_size_bytes = 25
+        self.cache.put("c", b"z" * 10)
+        
+        self.assertEqual(self.cache.get("a"), b"x" * 10)
+        self.assertIsNone(self.cache.get("b"))
+    
+    def test_uses_wal_journal(self):
+        """Test that the database runs in WAL mode."""
+        mode = self.cache.connection.execute('PRAGMA journal_mode').fetchone()[0]
+        self.assertEqual(mode, 'wal')
+
+
+if __name__ == '__main__':
+    unittest.main()
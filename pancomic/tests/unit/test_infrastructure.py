@@ -11,6 +11,8 @@ from pancomic.core.config_manager import ConfigManager
 from pancomic.core.logger import Logger
 from pancomic.infrastructure.database import Database
 from pancomic.infrastructure.image_cache import ImageCache
+from pancomic.infrastructure.anime_history_manager import AnimeHistoryManager
+from pancomic.models.anime import Anime
 from pancomic.models.comic import Comic
 from pancomic.models.chapter import Chapter
 
@@ -269,5 +271,34 @@ class TestImageCache(unittest.TestCase):
         self.assertEqual(len(filename), 70)  # SHA256 hash (64 chars) + '.cache' (6 chars)
 
 
+class TestAnimeHistoryManager(unittest.TestCase):
+    """Test AnimeHistoryManager functionality."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.storage_path = Path(self.temp_dir) / "anime_history.json"
+        self.manager = AnimeHistoryManager(str(self.storage_path))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_reload_if_changed_skips_own_writes(self):
+        """Test that saving does not trigger a reload."""
+        self.manager.add(Anime(id=1, name="Test Anime"))
+        self.assertFalse(self.manager.reload_if_changed())
+        self.assertEqual(self.manager.count(), 1)
+    
+    def test_reload_if_changed_picks_up_external_writes(self):
+        """Test that external modifications are reloaded."""
+        other = AnimeHistoryManager(str(self.storage_path))
+        other.add(Anime(id=2, name="Other Anime"))
+        
+        self.assertTrue(self.manager.reload_if_changed())
+        self.assertEqual(self.manager.count(), 1)
+        self.assertFalse(self.manager.reload_if_changed())
+
+
 if __name__ == '__main__':
     unittest.main()
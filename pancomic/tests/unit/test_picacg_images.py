@@ -0,0 +1,65 @@
+"""Unit tests for PicACG image loading."""
+
+import unittest
+from unittest import mock
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QColor, QImage, QImageReader
+from PySide6.QtWidgets import QApplication
+from pancomic.ui.widgets import picacg_images
+
+
+def _encode(image_format: str) -> bytes:
+    """Encode a small solid image in the given format."""
+    image = QImage(40, 30, QImage.Format_RGB32)
+    image.fill(QColor('red'))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, image_format)
+    return bytes(data)
+
+
+class TestImageFormat(unittest.TestCase):
+    """Test cases for sniffing the image format from magic bytes."""
+    
+    def test_known_formats(self):
+        """Test that JPEG, PNG, WebP and GIF signatures are recognized."""
+        self.assertEqual(picacg_images._image_format(b'\xff\xd8\xff\xe0'), "JPEG")
+        self.assertEqual(picacg_images._image_format(b'\x89PNG\r\n\x1a\n'), "PNG")
+        self.assertEqual(picacg_images._image_format(b'RIFF\x00\x00\x00\x00WEBPVP8 '), "WEBP")
+        self.assertEqual(picacg_images._image_format(b'GIF89a'), "GIF")
+    
+    def test_unknown_format(self):
+        """Test that unrecognized data is left to Qt's detection."""
+        self.assertIsNone(picacg_images._image_format(b'garbage'))
+        self.assertIsNone(picacg_images._image_format(b''))
+
+
+class TestDecodeScaledQt(unittest.TestCase):
+    """Test cases for the QImageReader fallback decoder."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.app = QApplication.instance() or QApplication([])
+    
+    def test_reader_gets_sniffed_format(self):
+        """Test that the sniffed format is passed to QImageReader."""
+        data = _encode('PNG')
+        with mock.patch.object(picacg_images, 'QImageReader', wraps=QImageReader) as reader:
+            decoded = picacg_images._decode_scaled_qt(data, (20, 20))
+        
+        self.assertEqual(reader.call_args.args[1], b"PNG")
+        self.assertIsNotNone(decoded)
+        self.assertEqual(decoded[1:3], (20, 15))
+    
+    def test_unknown_format_still_decodes(self):
+        """Test that data without a known signature falls back to Qt's probing."""
+        with mock.patch.object(picacg_images, 'QImageReader', wraps=QImageReader) as reader:
+            decoded = picacg_images._decode_scaled_qt(_encode('BMP'), (20, 20))
+        
+        self.assertEqual(reader.call_args.args[1], b"")
+        self.assertIsNotNone(decoded)
+
+
+if __name__ == '__main__':
+    unittest.main()
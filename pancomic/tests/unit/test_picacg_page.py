@@ -0,0 +1,117 @@
+"""Unit tests for the PicACG page."""
+
+import unittest
+from unittest import mock
+from PySide6.QtWidgets import QApplication
+from pancomic.adapters import PicACGAdapter
+from pancomic.models.chapter import Chapter
+from pancomic.models.comic import Comic
+from pancomic.ui.pages import picacg_page
+from pancomic.ui.pages import _picacg_strings as strings
+
+
+def _make_page() -> picacg_page.PicACGPage:
+    """Create a PicACG page over an adapter that never touches the network."""
+    adapter = PicACGAdapter({})
+    adapter._is_initialized = True
+    with mock.patch.object(picacg_page, 'cover_cache', return_value=None):
+        return picacg_page.PicACGPage(adapter, None)
+
+
+class TestPicACGPageComicSelection(unittest.TestCase):
+    """Test cases for selecting a comic on the PicACG page."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.app = QApplication.instance() or QApplication([])
+        self.page = _make_page()
+        self.adapter = self.page.adapter
+        self.comic = Comic(
+            id="comic1", title="Test", author="Author", cover_url="placeholder://no-cover",
+            description="", tags=[], categories=[], status="ongoing", chapter_count=1,
+            view_count=0, like_count=0, is_favorite=False, source="picacg"
+        )
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.page.deleteLater()
+    
+    def test_reselect_retries_after_chapters_failed(self):
+        """Test that clicking the selected comic again reloads chapters that failed."""
+        with mock.patch.object(self.adapter, 'get_chapters') as get_chapters, \
+                mock.patch.object(picacg_page, 'QMessageBox'):
+            self.page._on_comic_selected(self.comic)
+            self.page._on_chapters_failed("timeout")
+            self.page._on_comic_selected(self.comic)
+        
+        self.assertEqual(get_chapters.call_count, 2)
+    
+    def test_reselect_while_chapters_loading_does_nothing(self):
+        """Test that clicking the selected comic again does not duplicate a running request."""
+        with mock.patch.object(self.adapter, 'get_chapters') as get_chapters:
+            self.page._on_comic_selected(self.comic)
+            self.page._on_comic_selected(self.comic)
+        
+        self.assertEqual(get_chapters.call_count, 1)
+    
+    def test_reselect_after_chapters_loaded_does_nothing(self):
+        """Test that clicking the selected comic again does not refetch its chapters."""
+        chapter = Chapter(
+            id="1", comic_id="comic1", title="第1话", chapter_number=1, page_count=0,
+            is_downloaded=False, download_path=None, source="picacg"
+        )
+        with mock.patch.object(self.adapter, 'get_chapters') as get_chapters:
+            self.page._on_comic_selected(self.comic)
+            self.page._on_chapters_loaded([chapter])
+            self.page._on_comic_selected(self.comic)
+        
+        self.assertEqual(get_chapters.call_count, 1)
+
+
+
+class TestPicACGPageErrorDialogs(unittest.TestCase):
+    """Test cases for the dialogs explaining adapter errors."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.app = QApplication.instance() or QApplication([])
+        self.page = _make_page()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.page.deleteLater()
+    
+    def _dialog_title(self, handler, error: str) -> str:
+        """Get the title of the warning shown by a failure slot."""
+        with mock.patch.object(picacg_page, 'QMessageBox') as message_box:
+            handler(error)
+        return message_box.warning.call_args.args[1]
+    
+    def test_search_network_error_mentioning_500(self):
+        """Test that a search timeout with a 500 in it still gets the network dialog."""
+        title = self._dialog_title(self.page._on_search_failed, "HTTP 500: 网络超时")
+        self.assertEqual(title, strings.NETWORK_ERROR)
+    
+    def test_search_auth_before_network(self):
+        """Test that search errors check authentication before the network."""
+        title = self._dialog_title(self.page._on_search_failed, "login timeout")
+        self.assertEqual(title, strings.AUTH_FAILED)
+    
+    def test_chapters_auth_before_server(self):
+        """Test that chapter errors check authentication before server errors."""
+        title = self._dialog_title(self.page._on_chapters_failed, "认证失败 (500)")
+        self.assertEqual(title, strings.AUTH_FAILED)
+    
+    def test_images_server_before_auth(self):
+        """Test that image errors check server errors before authentication."""
+        title = self._dialog_title(self.page._on_images_failed, "login: HTTP 500")
+        self.assertEqual(title, strings.SERVER_ERROR)
+    
+    def test_images_no_source_first(self):
+        """Test that an image error from every API server gets the unavailable dialog."""
+        title = self._dialog_title(self.page._on_images_failed, "所有API服务器都无法获取此漫画的图片 (500)")
+        self.assertEqual(title, strings.IMAGES_LOAD_FAILED)
+
+
+if __name__ == '__main__':
+    unittest.main()
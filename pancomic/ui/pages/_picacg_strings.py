@@ -0,0 +1,101 @@
+"""User-visible strings of the PicACG page."""
+
+# Search bar
+SEARCH_PLACEHOLDER = "搜索PicACG漫画..."
+SEARCH = "搜索"
+SETTINGS = "设置"
+
+# Login status
+NOT_LOGGED_IN = "未登录"
+LOGGED_IN = "已登录"
+LOGIN_FAILED = "登录失败"
+
+# Results panel
+RESULTS = "搜索结果"
+RESULTS_COUNT = "搜索结果 ({count} 个)"
+SEARCHING = "搜索中..."
+SEARCH_FAILED = "搜索失败"
+PREV_PAGE = "上一页"
+NEXT_PAGE = "下一页"
+FIRST_PAGE = "第 1 页"
+PAGE_OF = "第 {page} / {total} 页"
+NO_THUMBNAIL = "无图"
+CARD_AUTHOR = "作者: {author}"
+
+# Details panel
+DETAILS_PLACEHOLDER = "← 选择一个漫画查看详情"
+READ = "阅读"
+DOWNLOAD = "下载"
+ADD_TO_QUEUE = "加入队列"
+NO_COVER = "无封面"
+LOADING = "加载中..."
+LOAD_FAILED = "加载失败"
+AUTHOR = "作者: {author}"
+CATEGORY = "分类: {categories}"
+CHAPTERS_LOADING = "章节: 加载中..."
+CHAPTERS_COUNT = "章节: {count} 话"
+CHAPTERS_FAILED = "章节: 加载失败"
+CHAPTER_BUTTON = "第{number}话"
+
+# Message boxes
+SEARCH_ERROR = "搜索错误"
+LOGIN_REQUIRED = "请先在设置中登录PicACG账号"
+SELECT_COMIC_FIRST = "请先选择一个漫画"
+CHAPTERS_NOT_READY = "章节加载中，请稍后再试"
+
+AUTH_FAILED = "认证失败"
+AUTH_EXPIRED = (
+    "登录状态已过期，请重新登录。\n\n"
+    "请到设置页面重新登录PicACG账号。"
+)
+
+NETWORK_ERROR = "网络错误"
+NETWORK_UNSTABLE = (
+    "网络连接超时或不稳定。\n\n"
+    "建议解决方案：\n"
+    "• 检查网络连接\n"
+    "• 在设置中切换API服务器\n"
+    "• 稍后重试"
+)
+SEARCH_ERROR_DETAIL = (
+    "搜索时发生错误：{error}\n\n"
+    "请检查网络连接或稍后重试。"
+)
+
+SERVER_ERROR = "服务器错误"
+CHAPTERS_SERVER_ERROR = (
+    "服务器返回错误，无法加载章节列表。\n\n"
+    "建议解决方案：\n"
+    "• 稍后重试\n"
+    "• 在设置中切换API服务器\n"
+    "• 尝试其他漫画"
+)
+CHAPTERS_LOAD_FAILED = "章节加载失败"
+CHAPTERS_ERROR_DETAIL = (
+    "无法加载章节列表：{error}\n\n"
+    "请稍后重试或尝试其他漫画。"
+)
+
+IMAGES_LOAD_FAILED = "图片加载失败"
+IMAGES_UNAVAILABLE = (
+    "无法加载此漫画的图片。\n\n"
+    "可能的原因：\n"
+    "• 此漫画在服务器上暂时不可用\n"
+    "• 网络连接问题\n"
+    "• 服务器维护中\n\n"
+    "建议解决方案：\n"
+    "• 尝试其他漫画\n"
+    "• 稍后重试\n"
+    "• 在设置中切换API服务器\n"
+    "• 检查网络连接"
+)
+IMAGES_SERVER_ERROR = (
+    "服务器返回错误，请稍后重试。\n\n"
+    "如果问题持续存在，请尝试：\n"
+    "• 在设置中切换到其他API服务器\n"
+    "• 尝试阅读其他漫画"
+)
+IMAGES_ERROR_DETAIL = (
+    "无法加载图片：{error}\n\n"
+    "请稍后重试或尝试其他漫画。"
+)
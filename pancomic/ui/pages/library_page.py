@@ -2,6 +2,8 @@
 
 import os
 import json
+import secrets
+import shutil
 import webbrowser
 from pathlib import Path
 from typing import List, Optional
@@ -9,7 +11,8 @@ from datetime import datetime
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QLabel,
-    QSplitter, QFrame, QScrollArea, QGridLayout, QMenu, QMessageBox, QSizePolicy
+    QSplitter, QFrame, QScrollArea, QGridLayout, QMenu, QMessageBox, QSizePolicy,
+    QApplication, QFileDialog
 )
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QAction, QCursor
@@ -23,6 +26,25 @@ from pancomic.ui.widgets.loading_widget import LoadingWidget
 from pancomic.infrastructure.anime_history_manager import AnimeHistoryManager
 
 
+# Image file extensions accepted when importing a folder (for str.endswith)
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp')
+
+# Reused encoder for compact metadata.json output
+_METADATA_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# Images below this size are copied with a single read/write
+_SMALL_IMAGE_SIZE = 1024 * 1024
+
+
+def _copy_small_file(src: str, dst: Path) -> None:
+    """Copy a small file with one read and one write call, keeping its metadata like copy2."""
+    with open(src, 'rb') as sf:
+        data = sf.read()
+    with open(dst, 'wb') as df:
+        df.write(data)
+    shutil.copystat(src, dst)
+
+
 class LibraryPage(QWidget):
     """
     Resource library page with 50:50 split.
@@ -65,6 +87,9 @@ class LibraryPage(QWidget):
         # Anime cards list for theme support
         self._anime_cards = []
         
+        # Application-wide clipboard (singleton owned by QApplication)
+        self._clipboard = QApplication.clipboard()
+        
         # Setup UI
         self._setup_ui()
         
@@ -1243,21 +1268,22 @@ class LibraryPage(QWidget):
             comic: Comic to delete
         """
         try:
-            import shutil
-            
             # Delete comic directory
             comic_dir = self.download_path / comic.source / comic.id
             if comic_dir.exists():
                 shutil.rmtree(comic_dir)
             
-            # Refresh library
-            self.scan_library()
+            # Drop it from the in-memory library instead of rescanning
+            self.local_comics = [
+                c for c in self.local_comics
+                if not (c.id == comic.id and c.source == comic.source)
+            ]
+            self._chapters_map.pop(comic.id, None)
+            self._update_display()
             
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "删除成功", f"漫画《{comic.title}》已删除")
             
         except Exception as e:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "删除失败", f"删除漫画时出错: {str(e)}")
     
     def set_download_path(self, path: str) -> None:
@@ -1277,8 +1303,8 @@ class LibraryPage(QWidget):
     
     def refresh_anime_history(self) -> None:
         """Refresh the anime history display."""
-        # Reload from file first (in case another instance modified it)
-        self.anime_history_manager.reload()
+        # Reload from file only if another instance modified it
+        self.anime_history_manager.reload_if_changed()
         
         # Get anime history and local videos
         history_animes = self.anime_history_manager.get_all()
@@ -1359,9 +1385,7 @@ class LibraryPage(QWidget):
     
     def _copy_anime_link(self, anime: Anime) -> None:
         """Copy anime link to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(anime.bangumi_url)
+        self._clipboard.setText(anime.bangumi_url)
     
     def get_comic_count(self) -> int:
         """
@@ -1392,8 +1416,6 @@ class LibraryPage(QWidget):
     
     def _import_comic_folder(self) -> None:
         """Open file dialog to import a comic folder."""
-        from PySide6.QtWidgets import QFileDialog
-        
         folder = QFileDialog.getExistingDirectory(
             self,
             "选择漫画文件夹",
@@ -1411,41 +1433,44 @@ class LibraryPage(QWidget):
         Args:
             folder_path: Path to the folder containing images
         """
-        import shutil
-        import uuid
-        
         folder = Path(folder_path)
         
         # Check if folder contains images
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'}
-        images = sorted([
-            f for f in folder.iterdir() 
-            if f.is_file() and f.suffix.lower() in image_extensions
-        ])
+        with os.scandir(folder) as it:
+            images = sorted(
+                (
+                    entry for entry in it
+                    if entry.name.lower().endswith(_IMAGE_EXTENSIONS) and entry.is_file()
+                ),
+                key=lambda entry: entry.name
+            )
         
         if not images:
             QMessageBox.warning(self, "导入失败", "所选文件夹中没有找到图片文件")
             return
         
-        # Create user folder if not exists
-        user_dir = self.download_path / 'user'
-        user_dir.mkdir(parents=True, exist_ok=True)
-        
         # Generate unique ID for this comic
-        comic_id = str(uuid.uuid4())[:8]
+        user_dir = self.download_path / 'user'
+        comic_id = secrets.token_hex(4)
         comic_dir = user_dir / comic_id
         chapter_dir = comic_dir / 'chapter_1'
+        
+        # Create user/comic/chapter folders in one call
         chapter_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy images to chapter folder
+        # Copy images to chapter folder; the first one is the cover
+        cover_path = None
         for i, img in enumerate(images):
-            dest = chapter_dir / f"{i+1:03d}{img.suffix}"
-            shutil.copy2(img, dest)
-        
-        # Get cover (first image)
-        cover_path = chapter_dir / f"001{images[0].suffix}"
+            dest = chapter_dir / f"{i+1:03d}{os.path.splitext(img.name)[1]}"
+            if img.stat().st_size < _SMALL_IMAGE_SIZE:
+                _copy_small_file(img.path, dest)
+            else:
+                shutil.copy2(img.path, dest)
+            if cover_path is None:
+                cover_path = dest
         
         # Create metadata
+        now_iso = datetime.now().isoformat()
         metadata = {
             'id': comic_id,
             'title': folder.name,
@@ -1460,8 +1485,8 @@ class LibraryPage(QWidget):
             'like_count': 0,
             'is_favorite': False,
             'source': 'user',
-            'created_at': datetime.now().isoformat(),
-            'imported_at': datetime.now().isoformat(),
+            'created_at': now_iso,
+            'imported_at': now_iso,
             'chapters': {
                 '1': {
                     'id': '1',
@@ -1469,31 +1494,32 @@ class LibraryPage(QWidget):
                     'chapter_number': 1,
                     'page_count': len(images),
                     'download_path': str(chapter_dir),
-                    'downloaded_at': datetime.now().isoformat()
+                    'downloaded_at': now_iso
                 }
             }
         }
         
-        # Save metadata
+        # Save metadata (write to a temp file, then atomically swap it in)
         metadata_file = comic_dir / 'metadata.json'
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-        
-        # Refresh library
-        self.scan_library()
+        tmp_file = metadata_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(_METADATA_ENCODER.encode(metadata))
+        os.replace(tmp_file, metadata_file)
+        
+        # Add the new comic to the in-memory library instead of rescanning
+        self.local_comics.append(Comic.from_dict(metadata))
+        self._chapters_map[comic_id] = metadata['chapters']
+        self._update_display()
         
         QMessageBox.information(self, "导入成功", f"已导入漫画《{folder.name}》\n共 {len(images)} 张图片")
     
     def dragEnterEvent(self, event) -> None:
         """Handle drag enter event for folder drop."""
         if event.mimeData().hasUrls():
-            # Check if any URL is a directory
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    path = Path(url.toLocalFile())
-                    if path.is_dir():
-                        event.acceptProposedAction()
-                        return
+            # Accept any local file drag; dropEvent checks for a directory
+            if any(url.isLocalFile() for url in event.mimeData().urls()):
+                event.acceptProposedAction()
+                return
         event.ignore()
     
     def dragMoveEvent(self, event) -> None:
@@ -1505,10 +1531,12 @@ class LibraryPage(QWidget):
         """Handle drop event for folder import."""
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    path = Path(url.toLocalFile())
-                    if path.is_dir():
-                        self._do_import_folder(str(path))
-                        event.acceptProposedAction()
-                        return
+                if not url.isLocalFile():
+                    continue
+                path = url.toLocalFile()
+                if os.path.isdir(path):
+                    # Finish the drop before the (blocking) import starts
+                    event.acceptProposedAction()
+                    QTimer.singleShot(0, lambda: self._do_import_folder(path))
+                    return
         event.ignore()
\ No newline at end of file
@@ -5,23 +5,400 @@ This page uses the PicACGWrapper to integrate directly with the original
 PicACG-qt project, providing a more stable and feature-complete experience.
 """
 
-from typing import Optional, List
+import re
+import weakref
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Optional, List, Dict, Tuple, Pattern
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QPushButton, 
-    QLabel, QLineEdit, QScrollArea, QFrame, QMessageBox, QSizePolicy,
-    QComboBox, QProgressBar
+    QLabel, QLineEdit, QMessageBox, QComboBox, QProgressBar, QListView, QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QObject, QThreadPool, QRect, QSize,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QPainter, QColor, QPen, QFont
 
 from pancomic.integrations.picacg_wrapper import PicACGWrapper
 from pancomic.models.comic import Comic
 from pancomic.models.chapter import Chapter
 from pancomic.infrastructure.download_manager import DownloadManager
+from pancomic.ui.widgets.picacg_images import (
+    ImageSignals, ImageTask, WarmUpTask, configure_session, cover_cache, pixmap_from_rgb
+)
+
+# Friendly names for known API endpoints / image servers (host substring -> name)
+_API_ENDPOINT_NAMES = {
+    'picaapi.picacomic.com': '官方API',
+    'bika-api.jpacg.cc': 'JP反代分流',
+    'bika2-api.jpacg.cc': 'US反代分流',
+    '104.21.91.145': 'IP直连1',
+    '188.114.98.153': 'IP直连2',
+}
+
+_IMAGE_SERVER_NAMES = {
+    'storage.diwodiwo.xyz': 'Diwo分流',
+    's3.picacomic.com': 'S3分流',
+    's2.picacomic.com': 'S2分流',
+    'storage1.picacomic.com': 'Storage1分流',
+    'storage-b.picacomic.com': 'Storage-B分流',
+}
+
+
+# One alternation per table, so a lookup is a single regex scan
+_API_ENDPOINT_RE = re.compile('|'.join(map(re.escape, _API_ENDPOINT_NAMES)))
+_IMAGE_SERVER_RE = re.compile('|'.join(map(re.escape, _IMAGE_SERVER_NAMES)))
+
+
+def _friendly_name(address: str, pattern: Pattern, names: Dict[str, str]) -> str:
+    """Get the friendly name of a server address, or the address itself."""
+    match = pattern.search(address)
+    return names[match.group(0)] if match else address
+
+
+def _pick_fastest(results: Dict[str, float]) -> Tuple[Optional[str], float]:
+    """
+    Pick the fastest reachable server from speed test results.
+    
+    Args:
+        results: Server -> response time in ms (-1 if unreachable)
+        
+    Returns:
+        Tuple of (server, time in ms), or (None, inf) if none is reachable
+    """
+    return min(
+        ((server, time_ms) for server, time_ms in results.items() if time_ms > 0),
+        key=itemgetter(1),
+        default=(None, float('inf'))
+    )
+
+
+# Display sizes of result thumbnails and the details cover
+_THUMBNAIL_SIZE = (45, 60)
+_COVER_SIZE = (200, 267)
+
+
+# Widget stylesheets, built once at import
+_LOGIN_STATUS_LOGGED_OUT_STYLE = "color: #ff4444; font-weight: bold; margin-left: 10px;"
+_LOGIN_STATUS_PENDING_STYLE = "color: #ffa500; font-weight: bold; margin-left: 10px;"
+_LOGIN_STATUS_LOGGED_IN_STYLE = "color: #00aa00; font-weight: bold; margin-left: 10px;"
+_SERVER_LABEL_STYLE = "color: #ffffff; font-size: 12px;"
+_PAGE_LABEL_STYLE = "color: #ffffff;"
+_DETAILS_PANEL_STYLE = "background-color: #252525;"
+_DETAILS_INFO_STYLE = "color: #cccccc; font-size: 13px;"
+
+_SPLITTER_STYLE = """
+    QSplitter::handle {
+        background-color: #3a3a3a;
+    }
+"""
+
+_SEARCH_CONTAINER_STYLE = """
+    QWidget {
+        background-color: #2b2b2b;
+        border-bottom: 1px solid #3a3a3a;
+    }
+"""
+
+_SEARCH_BAR_STYLE = """
+    QLineEdit {
+        background-color: #1e1e1e;
+        border: 1px solid #3a3a3a;
+        border-radius: 8px;
+        padding: 0 15px;
+        color: #ffffff;
+        font-size: 14px;
+    }
+    QLineEdit:focus {
+        border: 1px solid #0078d4;
+    }
+"""
+
+_PRIMARY_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #0078d4;
+        border: none;
+        border-radius: 8px;
+        color: #ffffff;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1084d8;
+    }
+    QPushButton:pressed {
+        background-color: #006cbd;
+    }
+"""
+
+_LOGIN_INPUT_STYLE = """
+    QLineEdit {
+        background-color: #1e1e1e;
+        border: 1px solid #3a3a3a;
+        border-radius: 6px;
+        padding: 0 10px;
+        color: #ffffff;
+        font-size: 12px;
+    }
+    QLineEdit:focus {
+        border: 1px solid #0078d4;
+    }
+"""
+
+_LOGIN_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #28a745;
+        border: none;
+        border-radius: 6px;
+        color: #ffffff;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #34ce57;
+    }
+    QPushButton:pressed {
+        background-color: #1e7e34;
+    }
+"""
+
+_RESULTS_LABEL_STYLE = """
+    QLabel {
+        color: #ffffff;
+        font-size: 16px;
+        font-weight: bold;
+    }
+"""
+
+_PAGE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #3a3a3a;
+        border: none;
+        border-radius: 4px;
+        color: #ffffff;
+        padding: 0 20px;
+    }
+    QPushButton:hover:enabled {
+        background-color: #4a4a4a;
+    }
+    QPushButton:disabled {
+        color: #666666;
+    }
+"""
+
+_DETAILS_PLACEHOLDER_STYLE = """
+    QLabel {
+        color: #888888;
+        font-size: 14px;
+    }
+"""
 
-# Disable SSL warnings
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+_COVER_LABEL_STYLE = """
+    QLabel {
+        background-color: #1e1e1e;
+        border-radius: 8px;
+    }
+"""
+
+_DETAILS_TITLE_STYLE = """
+    QLabel {
+        color: #ffffff;
+        font-size: 16px;
+        font-weight: bold;
+    }
+"""
+
+_SERVER_COMBO_STYLE = """
+    QComboBox {
+        background-color: #1e1e1e;
+        border: 1px solid #3a3a3a;
+        border-radius: 4px;
+        padding: 5px;
+        color: #ffffff;
+        font-size: 11px;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #ffffff;
+        margin-right: 5px;
+    }
+"""
+
+_TEST_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #6c757d;
+        border: none;
+        border-radius: 4px;
+        color: #ffffff;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: #7c8287;
+    }
+    QPushButton:pressed {
+        background-color: #5a6268;
+    }
+"""
+
+# Stylesheet of the results panel
+_RESULTS_PANEL_QSS = """
+    * {
+        background-color: #1e1e1e;
+    }
+    QListView {
+        border: none;
+    }
+"""
+
+
+def _device_size(size: Tuple[int, int], dpr: float) -> Tuple[int, int]:
+    """Get the size in device pixels of a logical (width, height) size."""
+    return round(size[0] * dpr), round(size[1] * dpr)
+
+
+def _cache_key(url: str, size: Tuple[int, int]) -> str:
+    """Get the QPixmapCache key of an image scaled to the given size."""
+    return f"{url}@{size[0]}x{size[1]}"
+
+
+class _ResultsModel(QAbstractListModel):
+    """List model over the parallel display columns of the current result page."""
+    
+    IdRole = Qt.UserRole + 1
+    AuthorRole = Qt.UserRole + 2
+    CoverRole = Qt.UserRole + 3
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize results model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._columns: Dict[str, List[str]] = {'id': [], 'title': [], 'author': [], 'cover': []}
+    
+    def set_columns(self, columns: Dict[str, List[str]]) -> None:
+        """Replace the displayed page."""
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get number of results on the current page."""
+        return 0 if parent.isValid() else len(self._columns['id'])
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get display data of a result row."""
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._columns['title'][row]
+        if role == self.AuthorRole:
+            return self._columns['author'][row]
+        if role == self.CoverRole:
+            return self._columns['cover'][row]
+        if role == self.IdRole:
+            return self._columns['id'][row]
+        return None
+    
+    def cover_changed(self, url: str) -> None:
+        """Repaint the rows showing the given cover URL."""
+        for row, cover in enumerate(self._columns['cover']):
+            if cover == url:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+
+class _ResultDelegate(QStyledItemDelegate):
+    """Paints a result row as a card: thumbnail, bold title and author line."""
+    
+    CARD_HEIGHT = 80
+    CARD_SPACING = 5
+    
+    def __init__(self, failed_thumbs: set, parent: Optional[QObject] = None):
+        """
+        Initialize result delegate.
+        
+        Args:
+            failed_thumbs: Thumbnail URLs that could not be loaded (owned by the page)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._failed_thumbs = failed_thumbs
+    
+    def sizeHint(self, option, index) -> QSize:
+        """Get the fixed card size."""
+        return QSize(option.rect.width(), self.CARD_HEIGHT + self.CARD_SPACING)
+    
+    def paint(self, painter: QPainter, option, index) -> None:
+        """Paint one result card."""
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        card = QRect(option.rect).adjusted(0, 0, -1, -1 - self.CARD_SPACING)
+        hover = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(QPen(QColor('#4a4a4a' if hover else '#3a3a3a')))
+        painter.setBrush(QColor('#3a3a3a' if hover else '#2b2b2b'))
+        painter.drawRoundedRect(card, 8, 8)
+        
+        # Thumbnail
+        thumb = QRect(card.left() + 10, card.top() + 10, *_THUMBNAIL_SIZE)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor('#1e1e1e'))
+        painter.drawRoundedRect(thumb, 4, 4)
+        
+        url = index.data(_ResultsModel.CoverRole)
+        dpr = option.widget.devicePixelRatioF() if option.widget is not None else 1.0
+        pixmap = QPixmapCache.find(_cache_key(url, _device_size(_THUMBNAIL_SIZE, dpr))) if url else None
+        if pixmap is not None:
+            x = thumb.left() + (thumb.width() - round(pixmap.width() / dpr)) // 2
+            y = thumb.top() + (thumb.height() - round(pixmap.height() / dpr)) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            if not url or url.startswith('placeholder'):
+                text = "无图"
+            elif url in self._failed_thumbs:
+                text = "×"
+            else:
+                text = "..."
+            painter.setPen(QColor('#666666'))
+            painter.drawText(thumb, Qt.AlignCenter, text)
+        
+        # Title and author
+        left = thumb.right() + 16
+        width = card.right() - 10 - left
+        
+        title_font = QFont(option.font)
+        title_font.setPixelSize(14)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(QColor('#ffffff'))
+        title_flags = Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap
+        title_rect = QRect(left, card.top() + 15, width, 36)
+        title_used = painter.boundingRect(title_rect, title_flags, index.data(Qt.DisplayRole))
+        painter.drawText(title_rect, title_flags, index.data(Qt.DisplayRole))
+        
+        author_font = QFont(option.font)
+        author_font.setPixelSize(12)
+        painter.setFont(author_font)
+        painter.setPen(QColor('#cccccc'))
+        author_top = title_rect.top() + min(title_used.height(), title_rect.height()) + 8
+        painter.drawText(
+            QRect(left, author_top, width, card.bottom() - author_top),
+            Qt.AlignLeft | Qt.AlignTop,
+            index.data(_ResultsModel.AuthorRole)
+        )
+        
+        painter.restore()
 
 
 class PicACGIntegratedPage(QWidget):
@@ -37,6 +414,10 @@ class PicACGIntegratedPage(QWidget):
     download_requested = Signal(object, list)  # Comic, List[Chapter]
     settings_requested = Signal()  # Request to navigate to settings
     
+    # Recently shown covers (url -> scaled QPixmap), least recently used first
+    _cover_cache: "OrderedDict[Tuple[str, float], QPixmap]" = OrderedDict()
+    _COVER_CACHE_MAX = 128
+    
     def __init__(self, config: dict, download_manager: DownloadManager, parent: Optional[QWidget] = None):
         """
         Initialize PicACG integrated page.
@@ -57,15 +438,47 @@ class PicACGIntegratedPage(QWidget):
         # State
         self._current_keyword = ""
         self._current_page = 1
-        self._total_results = 0
+        self._total_pages = 1
+        self._pagination_state: Optional[Tuple[int, int]] = None  # (page, total) last shown
+        self._inflight_search: Optional[Tuple[str, int]] = None  # (keyword, page) awaiting its reply
         self._results_per_page = 12
-        self._all_comics = []
+        # Current result page as parallel column lists (what the cards display)
+        self._comics_soa: Dict[str, List[str]] = {'id': [], 'title': [], 'author': [], 'cover': []}
+        self._comics_by_id: Dict[str, Comic] = {}
         self._selected_comic = None
         self._comic_chapters = []
+        self._chapters_asc = []  # _comic_chapters sorted by chapter number
         
         # Speed test state
         self._api_test_results = {}
         self._image_test_results = {}
+        self._api_idx: Dict[str, int] = {}  # endpoint -> api_combo index
+        self._img_idx: Dict[str, int] = {}  # server -> image_combo index
+        self._warm_server = ""  # image server last pre-connected to
+        
+        # Coalesce repeated search triggers into one request
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._perform_search)
+        
+        # Image loading: bounded pool, decoded and scaled in the workers
+        self._thumbnail_pool = QThreadPool(self)
+        self._thumbnail_pool.setMaxThreadCount(6)
+        self._thumbnail_signals = ImageSignals(self)
+        self._thumbnail_signals.finished.connect(self._on_thumbnail_loaded)
+        self._inflight_thumbs = set()  # thumbnail URLs being downloaded
+        self._failed_thumbs = set()  # thumbnail URLs that could not be loaded
+        # Downloaded image bytes survive restarts in the on-disk cache shared with PicACGPage
+        self._cover_disk_cache = cover_cache()
+        self._cover_signals = ImageSignals(self)
+        self._inflight_covers = set()  # cover URLs being downloaded
+        self._cover_signals.finished.connect(self._on_cover_loaded)
+        self._cover_url = ""
+        # Covers still referenced somewhere (at least the one on screen); the
+        # strong cache is _cover_cache, this only avoids duplicate pixmaps
+        self._cover_pixmap: Optional[QPixmap] = None
+        self._cover_weak = weakref.WeakValueDictionary()  # (url, dpr) -> QPixmap
         
         # Setup UI
         self._setup_ui()
@@ -89,11 +502,7 @@ class PicACGIntegratedPage(QWidget):
         # Split view: Left (results) | Right (details)
         splitter = QSplitter(Qt.Horizontal)
         splitter.setHandleWidth(1)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #3a3a3a;
-            }
-        """)
+        splitter.setStyleSheet(_SPLITTER_STYLE)
         
         # Left panel: Search results
         self.results_panel = self._create_results_panel()
@@ -112,12 +521,7 @@ class PicACGIntegratedPage(QWidget):
         """Create search bar with integrated settings."""
         container = QWidget()
         container.setFixedHeight(120)  # Increased height for settings
-        container.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                border-bottom: 1px solid #3a3a3a;
-            }
-        """)
+        container.setStyleSheet(_SEARCH_CONTAINER_STYLE)
         
         layout = QVBoxLayout(container)
         layout.setContentsMargins(20, 10, 20, 10)
@@ -131,40 +535,13 @@ class PicACGIntegratedPage(QWidget):
         self.search_bar.setPlaceholderText("搜索PicACG漫画...")
         self.search_bar.setFixedHeight(40)
         self.search_bar.returnPressed.connect(self._on_search_triggered)
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e1e;
-                border: 1px solid #3a3a3a;
-                border-radius: 8px;
-                padding: 0 15px;
-                color: #ffffff;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0078d4;
-            }
-        """)
+        self.search_bar.setStyleSheet(_SEARCH_BAR_STYLE)
         
         # Search button
         self.search_button = QPushButton("搜索")
         self.search_button.setFixedSize(80, 40)
         self.search_button.clicked.connect(self._on_search_triggered)
-        self.search_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                border: none;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1084d8;
-            }
-            QPushButton:pressed {
-                background-color: #006cbd;
-            }
-        """)
+        self.search_button.setStyleSheet(_PRIMARY_BUTTON_STYLE)
         
         # Login section
         login_layout = QHBoxLayout()
@@ -186,39 +563,12 @@ class PicACGIntegratedPage(QWidget):
         self.login_button.clicked.connect(self._on_login_clicked)
         
         self.login_status = QLabel("未登录")
-        self.login_status.setStyleSheet("color: #ff4444; font-weight: bold; margin-left: 10px;")
+        self.login_status.setStyleSheet(_LOGIN_STATUS_LOGGED_OUT_STYLE)
         
         for widget in [self.email_input, self.password_input]:
-            widget.setStyleSheet("""
-                QLineEdit {
-                    background-color: #1e1e1e;
-                    border: 1px solid #3a3a3a;
-                    border-radius: 6px;
-                    padding: 0 10px;
-                    color: #ffffff;
-                    font-size: 12px;
-                }
-                QLineEdit:focus {
-                    border: 1px solid #0078d4;
-                }
-            """)
-        
-        self.login_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                border: none;
-                border-radius: 6px;
-                color: #ffffff;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #34ce57;
-            }
-            QPushButton:pressed {
-                background-color: #1e7e34;
-            }
-        """)
+            widget.setStyleSheet(_LOGIN_INPUT_STYLE)
+        
+        self.login_button.setStyleSheet(_LOGIN_BUTTON_STYLE)
         
         login_layout.addWidget(QLabel("邮箱:"))
         login_layout.addWidget(self.email_input)
@@ -240,7 +590,7 @@ class PicACGIntegratedPage(QWidget):
         
         # API endpoint selection
         api_label = QLabel("API服务器:")
-        api_label.setStyleSheet("color: #ffffff; font-size: 12px;")
+        api_label.setStyleSheet(_SERVER_LABEL_STYLE)
         
         self.api_combo = QComboBox()
         self.api_combo.setFixedHeight(30)
@@ -253,7 +603,7 @@ class PicACGIntegratedPage(QWidget):
         
         # Image server selection
         img_label = QLabel("图片服务器:")
-        img_label.setStyleSheet("color: #ffffff; font-size: 12px;")
+        img_label.setStyleSheet(_SERVER_LABEL_STYLE)
         
         self.image_combo = QComboBox()
         self.image_combo.setFixedHeight(30)
@@ -265,47 +615,10 @@ class PicACGIntegratedPage(QWidget):
         self.image_test_button.clicked.connect(self._test_image_servers)
         
         # Style for combos and test buttons
-        combo_style = """
-            QComboBox {
-                background-color: #1e1e1e;
-                border: 1px solid #3a3a3a;
-                border-radius: 4px;
-                padding: 5px;
-                color: #ffffff;
-                font-size: 11px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-                margin-right: 5px;
-            }
-        """
-        
-        test_button_style = """
-            QPushButton {
-                background-color: #6c757d;
-                border: none;
-                border-radius: 4px;
-                color: #ffffff;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #7c8287;
-            }
-            QPushButton:pressed {
-                background-color: #5a6268;
-            }
-        """
-        
-        self.api_combo.setStyleSheet(combo_style)
-        self.image_combo.setStyleSheet(combo_style)
-        self.api_test_button.setStyleSheet(test_button_style)
-        self.image_test_button.setStyleSheet(test_button_style)
+        self.api_combo.setStyleSheet(_SERVER_COMBO_STYLE)
+        self.image_combo.setStyleSheet(_SERVER_COMBO_STYLE)
+        self.api_test_button.setStyleSheet(_TEST_BUTTON_STYLE)
+        self.image_test_button.setStyleSheet(_TEST_BUTTON_STYLE)
         
         bottom_layout.addWidget(api_label)
         bottom_layout.addWidget(self.api_combo)
@@ -323,7 +636,7 @@ class PicACGIntegratedPage(QWidget):
     def _create_results_panel(self) -> QWidget:
         """Create left panel for search results."""
         panel = QWidget()
-        panel.setStyleSheet("background-color: #1e1e1e;")
+        panel.setStyleSheet(_RESULTS_PANEL_QSS)
         
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -332,36 +645,27 @@ class PicACGIntegratedPage(QWidget):
         # Results header
         header_layout = QHBoxLayout()
         self.results_label = QLabel("搜索结果")
-        self.results_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.results_label.setStyleSheet(_RESULTS_LABEL_STYLE)
         header_layout.addWidget(self.results_label)
         header_layout.addStretch()
         layout.addLayout(header_layout)
         
-        # Results scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-        
-        # Results container
-        self.results_container = QWidget()
-        self.results_layout = QVBoxLayout(self.results_container)
-        self.results_layout.setContentsMargins(0, 0, 0, 0)
-        self.results_layout.setSpacing(5)
-        self.results_layout.addStretch()
-        
-        scroll.setWidget(self.results_container)
-        layout.addWidget(scroll)
+        # Results list: one view, each row painted as a card by the delegate
+        self.results_model = _ResultsModel(self)
+        self.results_view = QListView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setItemDelegate(_ResultDelegate(self._failed_thumbs, self))
+        self.results_view.setUniformItemSizes(True)
+        self.results_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.results_view.setSelectionMode(QListView.NoSelection)
+        self.results_view.setMouseTracking(True)
+        self.results_view.viewport().setCursor(Qt.PointingHandCursor)
+        self.results_view.clicked.connect(self._on_result_clicked)
+        layout.addWidget(self.results_view)
+        
+        # Thumbnails are only fetched for rows inside the viewport
+        self.results_view.verticalScrollBar().valueChanged.connect(self._flush_visible_thumbs)
+        self.results_view.verticalScrollBar().rangeChanged.connect(self._flush_visible_thumbs)
         
         # Pagination controls
         pagination_layout = QHBoxLayout()
@@ -373,7 +677,7 @@ class PicACGIntegratedPage(QWidget):
         
         self.page_label = QLabel("第 1 页")
         self.page_label.setAlignment(Qt.AlignCenter)
-        self.page_label.setStyleSheet("color: #ffffff;")
+        self.page_label.setStyleSheet(_PAGE_LABEL_STYLE)
         
         self.next_button = QPushButton("下一页")
         self.next_button.setFixedHeight(32)
@@ -381,21 +685,7 @@ class PicACGIntegratedPage(QWidget):
         self.next_button.setEnabled(False)
         
         for btn in [self.prev_button, self.next_button]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3a3a3a;
-                    border: none;
-                    border-radius: 4px;
-                    color: #ffffff;
-                    padding: 0 20px;
-                }
-                QPushButton:hover:enabled {
-                    background-color: #4a4a4a;
-                }
-                QPushButton:disabled {
-                    color: #666666;
-                }
-            """)
+            btn.setStyleSheet(_PAGE_BUTTON_STYLE)
         
         pagination_layout.addWidget(self.prev_button)
         pagination_layout.addStretch()
@@ -410,7 +700,7 @@ class PicACGIntegratedPage(QWidget):
     def _create_details_panel(self) -> QWidget:
         """Create right panel for comic details."""
         panel = QWidget()
-        panel.setStyleSheet("background-color: #252525;")
+        panel.setStyleSheet(_DETAILS_PANEL_STYLE)
         
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -419,12 +709,7 @@ class PicACGIntegratedPage(QWidget):
         # Placeholder message
         self.details_placeholder = QLabel("← 选择一个漫画查看详情")
         self.details_placeholder.setAlignment(Qt.AlignCenter)
-        self.details_placeholder.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 14px;
-            }
-        """)
+        self.details_placeholder.setStyleSheet(_DETAILS_PLACEHOLDER_STYLE)
         layout.addWidget(self.details_placeholder)
         
         # Details content (hidden initially)
@@ -438,24 +723,13 @@ class PicACGIntegratedPage(QWidget):
         self.cover_label = QLabel()
         self.cover_label.setFixedSize(200, 267)  # 3:4 ratio
         self.cover_label.setAlignment(Qt.AlignCenter)
-        self.cover_label.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-            }
-        """)
+        self.cover_label.setStyleSheet(_COVER_LABEL_STYLE)
         details_layout.addWidget(self.cover_label, 0, Qt.AlignHCenter)
         
         # Title
         self.title_label = QLabel()
         self.title_label.setWordWrap(True)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.title_label.setStyleSheet(_DETAILS_TITLE_STYLE)
         details_layout.addWidget(self.title_label)
         
         # Info grid
@@ -469,7 +743,7 @@ class PicACGIntegratedPage(QWidget):
         self.chapters_label = QLabel()
         
         for label in [self.author_label, self.category_label, self.id_label, self.chapters_label]:
-            label.setStyleSheet("color: #cccccc; font-size: 13px;")
+            label.setStyleSheet(_DETAILS_INFO_STYLE)
             label.setWordWrap(True)
             info_layout.addWidget(label)
         
@@ -483,22 +757,7 @@ class PicACGIntegratedPage(QWidget):
         
         for btn in [self.read_button, self.download_button]:
             btn.setFixedHeight(40)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #0078d4;
-                    border: none;
-                    border-radius: 8px;
-                    color: #ffffff;
-                    font-size: 14px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #1084d8;
-                }
-                QPushButton:pressed {
-                    background-color: #006cbd;
-                }
-            """)
+            btn.setStyleSheet(_PRIMARY_BUTTON_STYLE)
         
         self.read_button.clicked.connect(self._on_read_clicked)
         self.download_button.clicked.connect(self._on_download_clicked)
@@ -515,9 +774,13 @@ class PicACGIntegratedPage(QWidget):
     
     def _initialize_wrapper(self) -> None:
         """Initialize the PicACG wrapper."""
+        # Image and API requests skip certificate checks unless configured otherwise
+        configure_session(self.config.get('verify_tls', False))
+        
         if self.wrapper.initialize():
             # Populate combo boxes
             self._populate_server_combos()
+            self._warm_up_image_server(self.wrapper.get_current_image_server())
             
             # Try auto-login
             self.wrapper.auto_login()
@@ -537,21 +800,11 @@ class PicACGIntegratedPage(QWidget):
         current_endpoint = self.wrapper.get_current_endpoint()
         
         self.api_combo.clear()
+        self._api_idx = {}
         for endpoint in api_endpoints:
-            # Create friendly names
-            if "picaapi.picacomic.com" in endpoint:
-                name = "官方API"
-            elif "bika-api.jpacg.cc" in endpoint:
-                name = "JP反代分流"
-            elif "bika2-api.jpacg.cc" in endpoint:
-                name = "US反代分流"
-            elif "104.21.91.145" in endpoint:
-                name = "IP直连1"
-            elif "188.114.98.153" in endpoint:
-                name = "IP直连2"
-            else:
-                name = endpoint
+            name = _friendly_name(endpoint, _API_ENDPOINT_RE, _API_ENDPOINT_NAMES)
             
+            self._api_idx[endpoint] = self.api_combo.count()
             self.api_combo.addItem(f"{name} ({endpoint})", endpoint)
             
             if endpoint == current_endpoint:
@@ -562,21 +815,11 @@ class PicACGIntegratedPage(QWidget):
         current_server = self.wrapper.get_current_image_server()
         
         self.image_combo.clear()
+        self._img_idx = {}
         for server in image_servers:
-            # Create friendly names
-            if "storage.diwodiwo.xyz" in server:
-                name = "Diwo分流"
-            elif "s3.picacomic.com" in server:
-                name = "S3分流"
-            elif "s2.picacomic.com" in server:
-                name = "S2分流"
-            elif "storage1.picacomic.com" in server:
-                name = "Storage1分流"
-            elif "storage-b.picacomic.com" in server:
-                name = "Storage-B分流"
-            else:
-                name = server
+            name = _friendly_name(server, _IMAGE_SERVER_RE, _IMAGE_SERVER_NAMES)
             
+            self._img_idx[server] = self.image_combo.count()
             self.image_combo.addItem(f"{name} ({server})", server)
             
             if server == current_server:
@@ -606,7 +849,7 @@ class PicACGIntegratedPage(QWidget):
         
         self.login_button.setEnabled(False)
         self.login_status.setText("登录中...")
-        self.login_status.setStyleSheet("color: #ffa500; font-weight: bold; margin-left: 10px;")
+        self.login_status.setStyleSheet(_LOGIN_STATUS_PENDING_STYLE)
         
         self.wrapper.login(email, password)
     
@@ -616,7 +859,7 @@ class PicACGIntegratedPage(QWidget):
         
         if success:
             self.login_status.setText("已登录")
-            self.login_status.setStyleSheet("color: #00aa00; font-weight: bold; margin-left: 10px;")
+            self.login_status.setStyleSheet(_LOGIN_STATUS_LOGGED_IN_STYLE)
             
             # Clear password for security
             self.password_input.clear()
@@ -624,7 +867,7 @@ class PicACGIntegratedPage(QWidget):
             print(f"✅ 登录成功: {message}")
         else:
             self.login_status.setText("登录失败")
-            self.login_status.setStyleSheet("color: #ff4444; font-weight: bold; margin-left: 10px;")
+            self.login_status.setStyleSheet(_LOGIN_STATUS_LOGGED_OUT_STYLE)
             
             QMessageBox.warning(self, "登录失败", message)
             print(f"❌ 登录失败: {message}")
@@ -633,7 +876,7 @@ class PicACGIntegratedPage(QWidget):
         """Handle login failure."""
         self.login_button.setEnabled(True)
         self.login_status.setText("未登录")
-        self.login_status.setStyleSheet("color: #ff4444; font-weight: bold; margin-left: 10px;")
+        self.login_status.setStyleSheet(_LOGIN_STATUS_LOGGED_OUT_STYLE)
         
         QMessageBox.critical(self, "登录错误", f"登录时发生错误：{error}")
         print(f"❌ 登录错误: {error}")
@@ -650,22 +893,51 @@ class PicACGIntegratedPage(QWidget):
         
         self._current_keyword = keyword
         self._current_page = 1
-        self._perform_search()
+        self._search_timer.start()
     
     def _perform_search(self) -> None:
         """Perform search with current keyword and page."""
         self.search_button.setEnabled(False)
         self.results_label.setText("搜索中...")
+        
+        # Replies do not say which search they answer, so only one is sent at a time;
+        # a newer keyword/page is sent once the running one returns
+        if self._inflight_search is not None:
+            return
+        
+        self._inflight_search = (self._current_keyword, self._current_page)
         self.wrapper.search(self._current_keyword, self._current_page)
     
-    def _on_search_completed(self, comics: List[Comic]) -> None:
-        """Handle search completion."""
+    def _finish_search(self) -> bool:
+        """
+        Mark the running search as answered.
+        
+        Returns:
+            True if it is still the search the user wants, False if a newer one was sent instead
+        """
+        key, self._inflight_search = self._inflight_search, None
+        if key is not None and key != (self._current_keyword, self._current_page):
+            self._perform_search()
+            return False
+        return True
+    
+    def _on_search_completed(self, comics: List[Comic], total_pages: int) -> None:
+        """Handle search completion (one server-side page of results)."""
+        if not self._finish_search():
+            return
+        
         self.search_button.setEnabled(True)
-        self._all_comics = comics
-        self._total_results = len(comics)
+        self._comics_soa = {
+            'id': [str(comic.id) for comic in comics],
+            'title': [comic.title for comic in comics],
+            'author': [f"作者: {comic.author}" for comic in comics],
+            'cover': [comic.cover_url for comic in comics],
+        }
+        self._comics_by_id = dict(zip(self._comics_soa['id'], comics))
+        self._total_pages = max(1, total_pages)
         
         # Update results label
-        self.results_label.setText(f"搜索结果 ({self._total_results} 个)")
+        self.results_label.setText(f"搜索结果 ({len(comics)} 个)")
         
         # Display current page
         self._display_current_page()
@@ -675,6 +947,9 @@ class PicACGIntegratedPage(QWidget):
     
     def _on_search_failed(self, error: str) -> None:
         """Handle search failure."""
+        if not self._finish_search():
+            return
+        
         self.search_button.setEnabled(True)
         self.results_label.setText("搜索失败")
         
@@ -682,160 +957,61 @@ class PicACGIntegratedPage(QWidget):
     
     def _display_current_page(self) -> None:
         """Display comics for current page."""
-        # Clear existing results
-        while self.results_layout.count() > 1:
-            item = self.results_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Calculate page range
-        start_idx = (self._current_page - 1) * self._results_per_page
-        end_idx = min(start_idx + self._results_per_page, self._total_results)
-        
-        # Display comics for this page
-        for i in range(start_idx, end_idx):
-            comic = self._all_comics[i]
-            card = self._create_result_card(comic)
-            self.results_layout.insertWidget(i - start_idx, card)
+        # Give thumbnails that failed on an earlier page another try
+        self._failed_thumbs.clear()
+        self.results_model.set_columns(self._comics_soa)
+        self.results_view.scrollToTop()
+        
+        # Wait for the view to lay out the rows before checking visibility
+        QTimer.singleShot(0, self._flush_visible_thumbs)
     
-    def _create_result_card(self, comic: Comic) -> QWidget:
-        """Create a result card widget."""
-        card = QFrame()
-        card.setFixedHeight(80)
-        card.setCursor(Qt.PointingHandCursor)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #2b2b2b;
-                border-radius: 8px;
-                border: 1px solid #3a3a3a;
-            }
-            QFrame:hover {
-                background-color: #3a3a3a;
-                border: 1px solid #4a4a4a;
-            }
-        """)
-        
-        layout = QHBoxLayout(card)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(15)
+    def _on_result_clicked(self, index: QModelIndex) -> None:
+        """Select the comic shown on a clicked result row."""
+        comic = self._comics_by_id.get(index.data(_ResultsModel.IdRole))
+        if comic is not None:
+            self._on_comic_selected(comic)
+    
+    def _flush_visible_thumbs(self, *args) -> None:
+        """Start loading the thumbnails of the rows inside the results viewport."""
+        rows = self.results_model.rowCount()
+        if not rows:
+            return
         
-        # Thumbnail
-        thumb = QLabel()
-        thumb.setFixedSize(45, 60)
-        thumb.setAlignment(Qt.AlignCenter)
-        thumb.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e1e;
-                border-radius: 4px;
-                color: #666666;
-            }
-        """)
-        thumb.setText("...")
-        layout.addWidget(thumb)
-        
-        # Load thumbnail asynchronously
-        self._load_thumbnail(thumb, comic.cover_url)
-        
-        # Info container
-        info_widget = QWidget()
-        info_widget.setMinimumWidth(200)
-        info_layout = QVBoxLayout(info_widget)
-        info_layout.setContentsMargins(0, 5, 0, 5)
-        info_layout.setSpacing(8)
+        viewport = self.results_view.viewport().rect()
+        first = self.results_view.indexAt(viewport.topLeft())
+        last = self.results_view.indexAt(viewport.bottomLeft())
+        start = first.row() if first.isValid() else 0
+        # Prefetch one row beyond the bottom edge
+        end = min(rows, (last.row() if last.isValid() else rows - 1) + 2)
         
-        # Title
-        title = QLabel(comic.title)
-        title.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-weight: bold;
-                font-size: 14px;
-                background-color: transparent;
-            }
-        """)
-        title.setWordWrap(True)
-        title.setMaximumHeight(36)
-        title.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        
-        # Author
-        author = QLabel(f"作者: {comic.author}")
-        author.setStyleSheet("""
-            QLabel {
-                color: #cccccc;
-                font-size: 12px;
-                background-color: transparent;
-            }
-        """)
-        author.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        info_layout.addWidget(title)
-        info_layout.addWidget(author)
-        info_layout.addStretch()
-        
-        layout.addWidget(info_widget, 1)
-        
-        # Make card clickable
-        card.mousePressEvent = lambda e: self._on_comic_selected(comic)
-        
-        return card
+        for row in range(start, end):
+            self._load_thumbnail(self.results_model.index(row).data(_ResultsModel.CoverRole))
     
-    def _load_thumbnail(self, label: QLabel, url: str) -> None:
-        """Load thumbnail image for result card."""
+    def _load_thumbnail(self, url: str) -> None:
+        """Load thumbnail image for a result row."""
         if not url or url.startswith('placeholder'):
-            label.setText("无图")
             return
         
-        # Use QThread to download thumbnail
-        from PySide6.QtCore import QThread, QObject, Signal
-        import requests
-        
-        class ThumbnailLoader(QObject):
-            finished = Signal(object)
-            
-            def __init__(self, url):
-                super().__init__()
-                self.url = url
-            
-            def load(self):
-                try:
-                    headers = {
-                        'User-Agent': 'okhttp/3.8.1',
-                        'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                    }
-                    
-                    response = requests.get(self.url, headers=headers, timeout=8, verify=False)
-                    if response.status_code == 200:
-                        pixmap = QPixmap()
-                        if pixmap.loadFromData(response.content):
-                            self.finished.emit(pixmap)
-                        else:
-                            self.finished.emit(None)
-                    else:
-                        self.finished.emit(None)
-                except Exception:
-                    self.finished.emit(None)
-        
-        def on_loaded(pixmap):
-            if pixmap and not pixmap.isNull():
-                scaled = pixmap.scaled(45, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                label.setPixmap(scaled)
-            else:
-                label.setText("×")
-        
-        thread = QThread()
-        loader = ThumbnailLoader(url)
-        loader.moveToThread(thread)
+        size = _device_size(_THUMBNAIL_SIZE, self.results_view.devicePixelRatioF())
+        if (url in self._inflight_thumbs or url in self._failed_thumbs
+                or QPixmapCache.find(_cache_key(url, size)) is not None):
+            return
         
-        thread.started.connect(loader.load)
-        loader.finished.connect(on_loaded)
-        loader.finished.connect(thread.quit)
+        self._inflight_thumbs.add(url)
+        task = ImageTask(url, size, self._thumbnail_signals, disk_cache=self._cover_disk_cache)
+        self._thumbnail_pool.start(task)
+    
+    def _on_thumbnail_loaded(self, url: str, decoded: Optional[Tuple[bytes, int, int, int]]) -> None:
+        """Cache a downloaded thumbnail and repaint the rows showing it."""
+        self._inflight_thumbs.discard(url)
         
-        thread.start()
+        if decoded is not None:
+            dpr = self.results_view.devicePixelRatioF()
+            QPixmapCache.insert(_cache_key(url, _device_size(_THUMBNAIL_SIZE, dpr)), pixmap_from_rgb(decoded, dpr))
+        else:
+            self._failed_thumbs.add(url)
         
-        # Store references
-        if not hasattr(self, '_thumbnail_threads'):
-            self._thumbnail_threads = []
-        self._thumbnail_threads.append((thread, loader))
+        self.results_model.cover_changed(url)
     
     def _on_comic_selected(self, comic: Comic) -> None:
         """Handle comic selection."""
@@ -860,65 +1036,65 @@ class PicACGIntegratedPage(QWidget):
     
     def _load_cover(self, url: str) -> None:
         """Load cover image from URL."""
+        self._cover_url = url
+        self._cover_pixmap = None
+        
         if not url or url.startswith('placeholder'):
             self.cover_label.setText("无封面")
             return
         
-        self.cover_label.setText("加载中...")
-        
-        # Similar to thumbnail loading but for cover
-        from PySide6.QtCore import QThread, QObject, Signal
-        import requests
-        
-        class ImageLoader(QObject):
-            finished = Signal(object)
-            
-            def __init__(self, url):
-                super().__init__()
-                self.url = url
-            
-            def load(self):
-                try:
-                    headers = {
-                        'User-Agent': 'okhttp/3.8.1',
-                        'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                    }
-                    
-                    response = requests.get(self.url, headers=headers, timeout=15, verify=False)
-                    if response.status_code == 200:
-                        pixmap = QPixmap()
-                        if pixmap.loadFromData(response.content):
-                            self.finished.emit(pixmap)
-                        else:
-                            self.finished.emit(None)
-                    else:
-                        self.finished.emit(None)
-                except Exception:
-                    self.finished.emit(None)
-        
-        def on_image_loaded(pixmap):
-            if pixmap and not pixmap.isNull():
-                scaled = pixmap.scaled(200, 267, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.cover_label.setPixmap(scaled)
-            else:
-                self.cover_label.setText("加载失败")
+        # Covers are decoded at the screen's pixel ratio, so HiDPI gets its own entries
+        dpr = self.cover_label.devicePixelRatioF()
+        cached = self._cover_cache.get((url, dpr))
+        if cached is not None:
+            self._cover_cache.move_to_end((url, dpr))
+        else:
+            cached = self._cover_weak.get((url, dpr))
+        if cached is not None:
+            self._show_cover(url, cached)
+            return
         
-        thread = QThread()
-        loader = ImageLoader(url)
-        loader.moveToThread(thread)
+        self.cover_label.setText("加载中...")
         
-        thread.started.connect(loader.load)
-        loader.finished.connect(on_image_loaded)
+        # Same cover already downloading (e.g. quick back-and-forth clicks), just wait for it
+        if url in self._inflight_covers:
+            return
         
-        thread.start()
+        self._inflight_covers.add(url)
+        task = ImageTask(url, _device_size(_COVER_SIZE, dpr), self._cover_signals,
+                          timeout=15, disk_cache=self._cover_disk_cache)
+        self._thumbnail_pool.start(task)
+    
+    def _on_cover_loaded(self, url: str, decoded: Optional[Tuple[bytes, int, int, int]]) -> None:
+        """Show a downloaded cover if its comic is still selected."""
+        self._inflight_covers.discard(url)
+        
+        if decoded is not None:
+            dpr = self.cover_label.devicePixelRatioF()
+            pixmap = pixmap_from_rgb(decoded, dpr)
+            self._cover_cache[(url, dpr)] = pixmap
+            if len(self._cover_cache) > self._COVER_CACHE_MAX:
+                self._cover_cache.popitem(last=False)
+        
+        if url != self._cover_url:
+            return
         
-        # Store reference
-        self._image_thread = thread
-        self._image_loader = loader
+        if decoded is not None:
+            self._show_cover(url, pixmap)
+        else:
+            self.cover_label.setText("加载失败")
+    
+    def _show_cover(self, url: str, pixmap: QPixmap) -> None:
+        """Show a cover pixmap, keeping it alive only while it is displayed."""
+        self._cover_pixmap = pixmap
+        self._cover_weak[(url, pixmap.devicePixelRatio())] = pixmap
+        self.cover_label.setPixmap(pixmap)
     
     def _on_chapters_loaded(self, chapters: List[Chapter]) -> None:
         """Handle chapters loaded."""
         self._comic_chapters = chapters
+        # PicACG may list chapters newest first, order them once here
+        self._chapters_asc = sorted(chapters, key=lambda c: c.chapter_number)
         self.chapters_label.setText(f"章节: {len(chapters)} 话")
         print(f"✅ 章节加载完成: {len(chapters)} 个章节")
     
@@ -941,29 +1117,11 @@ class PicACGIntegratedPage(QWidget):
             QMessageBox.warning(self, "阅读", "请先选择一个漫画")
             return
         
-        if not self._comic_chapters:
+        if not self._chapters_asc:
             QMessageBox.warning(self, "阅读", "章节加载中，请稍后再试")
             return
         
-        # Select first chapter (handle PicACG reverse order)
-        first_chapter = None
-        if len(self._comic_chapters) == 1:
-            first_chapter = self._comic_chapters[0]
-        else:
-            first_order = self._comic_chapters[0].chapter_number
-            last_order = self._comic_chapters[-1].chapter_number
-            
-            if first_order > last_order:
-                # Reverse order, select last as first
-                first_chapter = self._comic_chapters[-1]
-            else:
-                # Normal order, select first
-                first_chapter = self._comic_chapters[0]
-        
-        if first_chapter:
-            self.read_requested.emit(self._selected_comic, first_chapter)
-        else:
-            QMessageBox.warning(self, "阅读", "无法确定第一章节")
+        self.read_requested.emit(self._selected_comic, self._chapters_asc[0])
     
     def _on_download_clicked(self) -> None:
         """Handle download button click."""
@@ -971,34 +1129,34 @@ class PicACGIntegratedPage(QWidget):
             QMessageBox.warning(self, "下载", "请先选择一个漫画")
             return
         
-        if not self._comic_chapters:
+        if not self._chapters_asc:
             QMessageBox.warning(self, "下载", "章节加载中，请稍后再试")
             return
         
-        self.download_requested.emit(self._selected_comic, self._comic_chapters)
+        self.download_requested.emit(self._selected_comic, self._chapters_asc)
     
     def _on_prev_page(self) -> None:
         """Handle previous page button."""
-        if self._current_page > 1:
+        if self._current_page > 1 and self._inflight_search is None:
             self._current_page -= 1
-            self._display_current_page()
-            self._update_pagination()
+            self._perform_search()
     
     def _on_next_page(self) -> None:
         """Handle next page button."""
-        total_pages = (self._total_results + self._results_per_page - 1) // self._results_per_page
-        if self._current_page < total_pages:
+        if self._current_page < self._total_pages and self._inflight_search is None:
             self._current_page += 1
-            self._display_current_page()
-            self._update_pagination()
+            self._perform_search()
     
     def _update_pagination(self) -> None:
         """Update pagination controls."""
-        total_pages = (self._total_results + self._results_per_page - 1) // self._results_per_page
+        state = (self._current_page, self._total_pages)
+        if state == self._pagination_state:
+            return
         
-        self.page_label.setText(f"第 {self._current_page} / {total_pages} 页")
+        self._pagination_state = state
+        self.page_label.setText(f"第 {self._current_page} / {self._total_pages} 页")
         self.prev_button.setEnabled(self._current_page > 1)
-        self.next_button.setEnabled(self._current_page < total_pages)
+        self.next_button.setEnabled(self._current_page < self._total_pages)
     
     def _on_api_endpoint_changed(self, text: str) -> None:
         """Handle API endpoint change."""
@@ -1011,6 +1169,15 @@ class PicACGIntegratedPage(QWidget):
         server = self.image_combo.currentData()
         if server:
             self.wrapper.set_image_server(server)
+            self._warm_up_image_server(server)
+    
+    def _warm_up_image_server(self, server: str) -> None:
+        """Pre-connect to an image server in the background, once per server."""
+        if not server or server == self._warm_server:
+            return
+        
+        self._warm_server = server
+        self._thumbnail_pool.start(WarmUpTask(server))
     
     def _test_api_endpoints(self) -> None:
         """Test API endpoints speed."""
@@ -1029,21 +1196,13 @@ class PicACGIntegratedPage(QWidget):
         self.api_test_button.setEnabled(True)
         self.api_test_button.setText("测速")
         
-        # Find fastest endpoint
-        fastest_endpoint = None
-        fastest_time = float('inf')
-        
-        for endpoint, time_ms in results.items():
-            if time_ms > 0 and time_ms < fastest_time:
-                fastest_time = time_ms
-                fastest_endpoint = endpoint
+        fastest_endpoint, fastest_time = _pick_fastest(results)
         
         if fastest_endpoint:
             # Update combo box to show fastest
-            for i in range(self.api_combo.count()):
-                if self.api_combo.itemData(i) == fastest_endpoint:
-                    self.api_combo.setCurrentIndex(i)
-                    break
+            idx = self._api_idx.get(fastest_endpoint)
+            if idx is not None:
+                self.api_combo.setCurrentIndex(idx)
             
             QMessageBox.information(
                 self,
@@ -1058,21 +1217,13 @@ class PicACGIntegratedPage(QWidget):
         self.image_test_button.setEnabled(True)
         self.image_test_button.setText("测速")
         
-        # Find fastest server
-        fastest_server = None
-        fastest_time = float('inf')
-        
-        for server, time_ms in results.items():
-            if time_ms > 0 and time_ms < fastest_time:
-                fastest_time = time_ms
-                fastest_server = server
+        fastest_server, fastest_time = _pick_fastest(results)
         
         if fastest_server:
             # Update combo box to show fastest
-            for i in range(self.image_combo.count()):
-                if self.image_combo.itemData(i) == fastest_server:
-                    self.image_combo.setCurrentIndex(i)
-                    break
+            idx = self._img_idx.get(fastest_server)
+            if idx is not None:
+                self.image_combo.setCurrentIndex(idx)
             
             QMessageBox.information(
                 self,
@@ -1088,5 +1239,8 @@ class PicACGIntegratedPage(QWidget):
     
     def cleanup(self) -> None:
         """Clean up resources."""
+        self._thumbnail_pool.clear()
+        self._thumbnail_pool.waitForDone(1000)
+        
         if hasattr(self, 'wrapper'):
             self.wrapper.cleanup()
\ No newline at end of file
@@ -1,21 +1,515 @@
 """PicACG source page with split layout."""
 
-from typing import Optional, List
+import logging
+import re
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Optional, List, Tuple, Callable
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QPushButton, 
-    QLabel, QLineEdit, QScrollArea, QFrame, QMessageBox, QSizePolicy
+    QLabel, QLineEdit, QMessageBox, QListView, QStyledItemDelegate, QStyle
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QObject, QThreadPool, QRect, QSize, QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QPainter, QColor, QPen, QFont
 
 from pancomic.adapters.picacg_adapter import PicACGAdapter
 from pancomic.models.comic import Comic
 from pancomic.models.chapter import Chapter
 from pancomic.infrastructure.download_manager import DownloadManager
+from pancomic.ui.widgets.picacg_images import (
+    ImageSignals, ImageTask, configure_session, cover_cache, pixmap_from_rgb
+)
+from pancomic.ui.pages import _picacg_strings as strings
+
+# Child of the application logger, so level and handlers come from Logger.setup
+_logger = logging.getLogger('PanComic.picacg')
+
+
+def _thumbnail_key(url: str) -> str:
+    """Get the QPixmapCache key of a scaled-down result card thumbnail."""
+    return f"{url}@45x60"
+
+
+# Page colors per theme
+_PAGE_COLORS = {
+    'light': {
+        'bg_primary': '#FFFFFF', 'bg_secondary': '#F3F3F3', 'bg_card': '#FAFAFA',
+        'text_primary': '#000000', 'text_secondary': '#333333', 'text_muted': '#666666',
+        'border': '#E0E0E0', 'button_hover': '#CCCCCC', 'accent': '#0078D4',
+        'chapter_bg': '#E0E0E0', 'chapter_text': '#333333',
+    },
+    'dark': {
+        'bg_primary': '#1e1e1e', 'bg_secondary': '#2b2b2b', 'bg_card': '#252525',
+        'text_primary': '#ffffff', 'text_secondary': '#cccccc', 'text_muted': '#888888',
+        'border': '#3a3a3a', 'button_hover': '#4a4a4a', 'accent': '#0078d4',
+        'chapter_bg': '#3a3a3a', 'chapter_text': '#cccccc',
+    },
+}
+
+# The whole page is styled by one root stylesheet, selecting widgets by objectName/property
+_PAGE_QSS_TEMPLATE = """
+    #picacgPage, #resultsPanel {{
+        background-color: {bg_primary};
+    }}
+    #detailsPanel {{
+        background-color: {bg_card};
+    }}
+    QSplitter::handle {{
+        background-color: {border};
+    }}
+    #searchContainer {{
+        background-color: {bg_secondary};
+        border-bottom: 1px solid {border};
+    }}
+    QLineEdit#searchBar {{
+        background-color: {bg_primary};
+        border: 1px solid {border};
+        border-radius: 8px;
+        padding: 0 15px;
+        color: {text_primary};
+        font-size: 14px;
+    }}
+    QLineEdit#searchBar:focus {{
+        border: 1px solid {accent};
+    }}
+    QPushButton#searchButton, QPushButton#readButton {{
+        background-color: #0078d4;
+        border: none;
+        border-radius: 8px;
+        color: #ffffff;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QPushButton#searchButton:hover, QPushButton#readButton:hover {{
+        background-color: #1084d8;
+    }}
+    QPushButton#searchButton:pressed, QPushButton#readButton:pressed {{
+        background-color: #006cbd;
+    }}
+    QPushButton#settingsButton {{
+        background-color: #555555;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-size: 14px;
+    }}
+    QPushButton#settingsButton:hover {{
+        background-color: #666666;
+    }}
+    QPushButton#settingsButton:pressed {{
+        background-color: #444444;
+    }}
+    QLabel#loginStatus {{
+        color: #ff4444;
+        font-weight: bold;
+        margin-left: 20px;
+    }}
+    QLabel#loginStatus[loggedIn="true"] {{
+        color: #00aa00;
+    }}
+    QLabel#resultsLabel {{
+        color: {text_primary};
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QListView#resultsView {{
+        border: none;
+        background-color: transparent;
+    }}
+    QListView#resultsView QScrollBar:vertical {{
+        background-color: {bg_secondary};
+        width: 12px;
+    }}
+    QListView#resultsView QScrollBar::handle:vertical {{
+        background-color: {border};
+        border-radius: 6px;
+    }}
+    QLabel#pageLabel {{
+        color: {text_primary};
+    }}
+    QPushButton#prevButton, QPushButton#nextButton {{
+        background-color: {border};
+        border: none;
+        border-radius: 4px;
+        color: {text_primary};
+        padding: 0 20px;
+    }}
+    QPushButton#prevButton:hover:enabled, QPushButton#nextButton:hover:enabled {{
+        background-color: {button_hover};
+    }}
+    QPushButton#prevButton:disabled, QPushButton#nextButton:disabled {{
+        color: {text_muted};
+    }}
+    QLabel#detailsPlaceholder {{
+        color: {text_muted};
+        font-size: 14px;
+    }}
+    QLabel#coverLabel {{
+        background-color: {bg_primary};
+        border-radius: 8px;
+    }}
+    QLabel#titleLabel {{
+        color: {text_primary};
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QLabel[role="info"] {{
+        color: {text_secondary};
+        font-size: 13px;
+    }}
+    QPushButton#downloadButton, QPushButton#queueButton {{
+        border: none;
+        border-radius: 8px;
+        color: #ffffff;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QPushButton#downloadButton {{ background-color: #107c10; }}
+    QPushButton#downloadButton:hover {{ background-color: #0e6b0e; }}
+    QPushButton#downloadButton:pressed {{ background-color: #0c5a0c; }}
+    QPushButton#queueButton {{ background-color: #5c2d91; }}
+    QPushButton#queueButton:hover {{ background-color: #6b3fa0; }}
+    QPushButton#queueButton:pressed {{ background-color: #4a2373; }}
+"""
+
+_PAGE_QSS = {theme: _PAGE_QSS_TEMPLATE.format(**colors) for theme, colors in _PAGE_COLORS.items()}
+
+# Chapter grid geometry
+_CHAPTER_BUTTONS_PER_ROW = 6
+_CHAPTER_H_SPACING = 4
+_CHAPTER_V_SPACING = 5
+_CHAPTER_PADDING = (8, 4)  # horizontal, vertical
+
+# Patterns recognizing kinds of adapter error messages
+_ERROR_PATTERNS = {
+    'no_source': re.compile('所有API服务器都无法获取此漫画的图片'),
+    'auth': re.compile('认证|login', re.IGNORECASE),
+    'server': re.compile('500'),
+    'network': re.compile('网络|timeout', re.IGNORECASE),
+}
+
+# (kind, title, message) explained by each slot, checked in order; other errors get a generic dialog
+_SEARCH_ERROR_DIALOGS = (
+    ('auth', strings.AUTH_FAILED, strings.AUTH_EXPIRED),
+    ('network', strings.NETWORK_ERROR, strings.NETWORK_UNSTABLE),
+)
+_CHAPTERS_ERROR_DIALOGS = (
+    ('auth', strings.AUTH_FAILED, strings.AUTH_EXPIRED),
+    ('server', strings.SERVER_ERROR, strings.CHAPTERS_SERVER_ERROR),
+)
+_IMAGES_ERROR_DIALOGS = (
+    ('no_source', strings.IMAGES_LOAD_FAILED, strings.IMAGES_UNAVAILABLE),
+    ('server', strings.SERVER_ERROR, strings.IMAGES_SERVER_ERROR),
+    ('auth', strings.AUTH_FAILED, strings.AUTH_EXPIRED),
+)
+
+
+def _classify_error(error: str, dialogs: Tuple[Tuple[str, str, str], ...]) -> Optional[Tuple[str, str]]:
+    """
+    Find the dialog explaining an adapter error message.
+    
+    Args:
+        error: Error message
+        dialogs: (kind, title, message) entries in priority order
+    
+    Returns:
+        (title, message) of the first entry whose kind matches, or None
+    """
+    for kind, title, message in dialogs:
+        if _ERROR_PATTERNS[kind].search(error):
+            return title, message
+    return None
+
+
+# Result card colors per theme
+_CARD_COLORS = {
+    'light': {
+        'card': '#FAFAFA', 'card_hover': '#F0F0F0',
+        'border': '#E0E0E0', 'border_hover': '#CCCCCC',
+        'thumb': '#F3F3F3', 'title': '#000000', 'author': '#333333',
+    },
+    'dark': {
+        'card': '#2b2b2b', 'card_hover': '#3a3a3a',
+        'border': '#3a3a3a', 'border_hover': '#4a4a4a',
+        'thumb': '#1e1e1e', 'title': '#ffffff', 'author': '#cccccc',
+    },
+}
+
+
+class _ComicListModel(QAbstractListModel):
+    """List model over the comics of the current result page."""
+    
+    AuthorRole = Qt.UserRole + 1
+    CoverRole = Qt.UserRole + 2
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize comic list model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._comics: List[Comic] = []
+    
+    def set_comics(self, comics: List[Comic]) -> None:
+        """Replace the displayed page."""
+        self.beginResetModel()
+        self._comics = comics
+        self.endResetModel()
+    
+    def comic_at(self, row: int) -> Comic:
+        """Get the comic shown in a row."""
+        return self._comics[row]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get number of comics on the current page."""
+        return 0 if parent.isValid() else len(self._comics)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Get display data of a comic row."""
+        if not index.isValid():
+            return None
+        
+        comic = self._comics[index.row()]
+        if role == Qt.DisplayRole:
+            return comic.title
+        if role == self.AuthorRole:
+            return comic.author
+        if role == self.CoverRole:
+            return comic.cover_url
+        return None
+    
+    def cover_changed(self, url: str) -> None:
+        """Repaint the rows showing the given cover URL."""
+        for row, comic in enumerate(self._comics):
+            if comic.cover_url == url:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+
+class _ComicCardDelegate(QStyledItemDelegate):
+    """Paints a comic row as a card: thumbnail, bold title and author line."""
+    
+    CARD_HEIGHT = 80
+    CARD_SPACING = 5
+    
+    def __init__(self, request_thumbnail: Callable[[str], None], failed_thumbs: set,
+                 parent: Optional[QObject] = None):
+        """
+        Initialize comic card delegate.
+        
+        Args:
+            request_thumbnail: Called with a cover URL whose thumbnail is not loaded yet
+            failed_thumbs: Thumbnail URLs that could not be loaded (owned by the page)
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._request_thumbnail = request_thumbnail
+        self._failed_thumbs = failed_thumbs
+        self.theme = 'dark'
+    
+    def sizeHint(self, option, index) -> QSize:
+        """Get the fixed card size."""
+        return QSize(option.rect.width(), self.CARD_HEIGHT + self.CARD_SPACING)
+    
+    def paint(self, painter: QPainter, option, index) -> None:
+        """Paint one comic card."""
+        colors = _CARD_COLORS.get(self.theme, _CARD_COLORS['dark'])
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        card = QRect(option.rect).adjusted(0, 0, -1, -1 - self.CARD_SPACING)
+        hover = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(QPen(QColor(colors['border_hover' if hover else 'border'])))
+        painter.setBrush(QColor(colors['card_hover' if hover else 'card']))
+        painter.drawRoundedRect(card, 8, 8)
+        
+        # Thumbnail (only rows Qt actually paints ask for a download)
+        thumb = QRect(card.left() + 10, card.top() + 10, 45, 60)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(colors['thumb']))
+        painter.drawRoundedRect(thumb, 4, 4)
+        
+        url = index.data(_ComicListModel.CoverRole)
+        placeholder = not url or url.startswith('placeholder')
+        pixmap = None if placeholder else QPixmapCache.find(_thumbnail_key(url))
+        if pixmap is not None:
+            x = thumb.left() + (thumb.width() - pixmap.width()) // 2
+            y = thumb.top() + (thumb.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            if placeholder:
+                text = strings.NO_THUMBNAIL
+            elif url in self._failed_thumbs:
+                text = "×"
+            else:
+                text = "..."
+                self._request_thumbnail(url)
+            painter.setPen(QColor('#666666'))
+            painter.drawText(thumb, Qt.AlignCenter, text)
+        
+        # Title and author
+        left = thumb.right() + 16
+        width = card.right() - 10 - left
+        
+        title_font = QFont(option.font)
+        title_font.setPixelSize(14)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(QColor(colors['title']))
+        title_flags = Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap
+        title_rect = QRect(left, card.top() + 15, width, 36)
+        title_used = painter.boundingRect(title_rect, title_flags, index.data(Qt.DisplayRole))
+        painter.drawText(title_rect, title_flags, index.data(Qt.DisplayRole))
+        
+        author_font = QFont(option.font)
+        author_font.setPixelSize(12)
+        painter.setFont(author_font)
+        painter.setPen(QColor(colors['author']))
+        author_top = title_rect.top() + min(title_used.height(), title_rect.height()) + 8
+        painter.drawText(
+            QRect(left, author_top, width, card.bottom() - author_top),
+            Qt.AlignLeft | Qt.AlignTop,
+            strings.CARD_AUTHOR.format(author=index.data(_ComicListModel.AuthorRole))
+        )
+        
+        painter.restore()
 
-# Disable SSL warnings
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+class _ChapterGrid(QWidget):
+    """Chapter buttons painted in one widget, six per row, without child widgets."""
+    
+    chapter_clicked = Signal(object)  # Chapter
+    
+    def __init__(self, parent: Optional[QWidget] = None):
+        """
+        Initialize chapter grid.
+        
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.theme = 'dark'
+        self._chapters: List[Chapter] = []
+        self._labels: List[str] = []
+        self._cell = QSize(0, 0)
+        self._hovered = -1
+        
+        font = QFont(self.font())
+        font.setPixelSize(11)
+        self.setFont(font)
+        self.setMouseTracking(True)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setContentsMargins(0, 10, 0, 0)
+    
+    def set_chapters(self, chapters: List[Chapter], labels: List[str]) -> None:
+        """
+        Show buttons for the given chapters, in order.
+        
+        Args:
+            chapters: Chapters to show
+            labels: Button text of each chapter
+        """
+        self._chapters = chapters
+        self._labels = labels
+        self._hovered = -1
+        
+        # All cells share the width of the widest label so the columns line up
+        metrics = self.fontMetrics()
+        pad_x, pad_y = _CHAPTER_PADDING
+        widest = max((metrics.horizontalAdvance(label) for label in self._labels), default=0)
+        self._cell = QSize(widest + 2 * pad_x, metrics.height() + 2 * pad_y)
+        
+        self.updateGeometry()
+        self.update()
+    
+    def sizeHint(self) -> QSize:
+        """Size needed to show every chapter."""
+        if not self._chapters:
+            return QSize(0, 0)
+        
+        columns = min(len(self._chapters), _CHAPTER_BUTTONS_PER_ROW)
+        rows = (len(self._chapters) + _CHAPTER_BUTTONS_PER_ROW - 1) // _CHAPTER_BUTTONS_PER_ROW
+        margins = self.contentsMargins()
+        return QSize(
+            columns * (self._cell.width() + _CHAPTER_H_SPACING) - _CHAPTER_H_SPACING + margins.left() + margins.right(),
+            rows * (self._cell.height() + _CHAPTER_V_SPACING) - _CHAPTER_V_SPACING + margins.top() + margins.bottom()
+        )
+    
+    def minimumSizeHint(self) -> QSize:
+        """The grid does not wrap, so it needs its full size."""
+        return self.sizeHint()
+    
+    def _cell_rect(self, i: int) -> QRect:
+        """Rectangle of the i-th chapter button."""
+        row, col = divmod(i, _CHAPTER_BUTTONS_PER_ROW)
+        margins = self.contentsMargins()
+        return QRect(
+            margins.left() + col * (self._cell.width() + _CHAPTER_H_SPACING),
+            margins.top() + row * (self._cell.height() + _CHAPTER_V_SPACING),
+            self._cell.width(),
+            self._cell.height()
+        )
+    
+    def _index_at(self, x: float, y: float) -> int:
+        """Index of the chapter button under a point, or -1."""
+        margins = self.contentsMargins()
+        col = int(x - margins.left()) // (self._cell.width() + _CHAPTER_H_SPACING)
+        row = int(y - margins.top()) // (self._cell.height() + _CHAPTER_V_SPACING)
+        if x < margins.left() or y < margins.top() or col >= _CHAPTER_BUTTONS_PER_ROW:
+            return -1
+        
+        i = row * _CHAPTER_BUTTONS_PER_ROW + col
+        if i >= len(self._chapters) or not self._cell_rect(i).contains(int(x), int(y)):
+            return -1
+        return i
+    
+    def paintEvent(self, event) -> None:
+        """Draw the chapter buttons that intersect the exposed area."""
+        colors = _PAGE_COLORS.get(self.theme, _PAGE_COLORS['dark'])
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        exposed = event.rect()
+        
+        for i, label in enumerate(self._labels):
+            rect = self._cell_rect(i)
+            if not rect.intersects(exposed):
+                continue
+            
+            hovered = i == self._hovered
+            painter.setBrush(QColor('#0078d4' if hovered else colors['chapter_bg']))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(QColor('#ffffff' if hovered else colors['chapter_text']))
+            painter.drawText(rect, Qt.AlignCenter, label)
+            painter.setPen(Qt.NoPen)
+        
+        painter.end()
+    
+    def mouseMoveEvent(self, event) -> None:
+        """Track the hovered button."""
+        i = self._index_at(event.position().x(), event.position().y())
+        if i != self._hovered:
+            for old in (self._hovered, i):
+                if old >= 0:
+                    self.update(self._cell_rect(old))
+            self._hovered = i
+    
+    def leaveEvent(self, event) -> None:
+        """Clear hover when the mouse leaves the grid."""
+        if self._hovered >= 0:
+            self.update(self._cell_rect(self._hovered))
+            self._hovered = -1
+        super().leaveEvent(event)
+    
+    def mousePressEvent(self, event) -> None:
+        """Emit chapter_clicked for the button under the mouse."""
+        i = self._index_at(event.position().x(), event.position().y())
+        if i >= 0:
+            self.chapter_clicked.emit(self._chapters[i])
 
 
 class PicACGPage(QWidget):
@@ -32,6 +526,9 @@ class PicACGPage(QWidget):
     queue_requested = Signal(object, list)  # Comic, List[Chapter] - add to queue
     settings_requested = Signal()  # Request to navigate to settings
     
+    _CHAPTERS_CACHE_MAX = 64  # comics whose chapter lists are kept in memory
+    _SEARCH_CACHE_MAX = 32  # (keyword, page) search results kept in memory
+    
     def __init__(self, adapter: PicACGAdapter, download_manager: DownloadManager, parent: Optional[QWidget] = None):
         """
         Initialize PicACGPage.
@@ -51,11 +548,43 @@ class PicACGPage(QWidget):
         self._current_page = 1
         self._total_results = 0
         self._results_per_page = 12  # Same as JMComic
+        self._total_pages = 0
+        self._pagination_state: Optional[Tuple[int, int]] = None  # (page, total) last shown
         self._all_comics = []
+        self._search_cache: "OrderedDict[Tuple[str, int], List[Comic]]" = OrderedDict()
+        self._search_key: Optional[Tuple[str, int]] = None  # (keyword, page) the user asked for last
+        self._pending_search: Optional[Tuple[str, int]] = None  # (keyword, page) being fetched
         self._selected_comic = None
         self._comic_chapters = []
+        self._comic_chapters_sorted = []  # same chapters, ascending chapter_number
+        # comic id -> (chapters, chapters by chapter_number, button labels)
+        self._chapters_cache: "OrderedDict[str, Tuple[List[Chapter], List[Chapter], List[str]]]" = OrderedDict()
+        self._chapters_inflight = set()  # comic ids whose chapter request is running
         self._current_theme = 'dark'  # Track current theme
         
+        self._cover_url = ""
+        # Downloaded image bytes survive restarts in the on-disk cache shared with the integrated page
+        self._image_disk_cache = cover_cache()
+        # Image requests skip certificate checks unless configured otherwise
+        configure_session(self.adapter.config.get('verify_tls', False))
+        
+        # Images download on a bounded pool (browser-like 6 connections per host)
+        self._thumbnail_pool = QThreadPool(self)
+        self._thumbnail_pool.setMaxThreadCount(6)
+        self._thumbnail_signals = ImageSignals(self)
+        self._thumbnail_signals.finished.connect(self._on_thumbnail_loaded)
+        self._cover_signals = ImageSignals(self)
+        self._cover_signals.finished.connect(self._on_cover_loaded)
+        self._inflight_covers = set()  # cover URLs being downloaded
+        self._inflight_thumbs = set()  # thumbnail URLs being downloaded
+        self._failed_thumbs = set()  # thumbnail URLs that could not be loaded
+        # Thumbnails painted while scrolling are fetched a little later, and only if still visible
+        self._pending_thumbs = set()
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(150)
+        self._thumb_timer.timeout.connect(self._flush_pending_thumbs)
+        
         # Initialize adapter if needed
         if not self.adapter.is_initialized():
             self.adapter.initialize()
@@ -66,11 +595,15 @@ class PicACGPage(QWidget):
         # Connect signals
         self._connect_signals()
         
-        # Auto-login if enabled and credentials are stored
-        self._check_auto_login()
+        # Auto-login if enabled and credentials are stored, once the page is up
+        QTimer.singleShot(0, self._check_auto_login)
     
     def _setup_ui(self) -> None:
         """Setup the split layout UI."""
+        self.setObjectName("picacgPage")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet(_PAGE_QSS[self._current_theme])
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -82,11 +615,6 @@ class PicACGPage(QWidget):
         # Split view: Left (results) | Right (details)
         splitter = QSplitter(Qt.Horizontal)
         splitter.setHandleWidth(1)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #3a3a3a;
-            }
-        """)
         
         # Left panel: Search results
         self.results_panel = self._create_results_panel()
@@ -105,12 +633,7 @@ class PicACGPage(QWidget):
         """Create search bar widget."""
         self.search_container = QWidget()
         self.search_container.setFixedHeight(60)
-        self.search_container.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                border-bottom: 1px solid #3a3a3a;
-            }
-        """)
+        self.search_container.setObjectName("searchContainer")
         
         layout = QHBoxLayout(self.search_container)
         layout.setContentsMargins(20, 10, 20, 10)
@@ -118,67 +641,26 @@ class PicACGPage(QWidget):
         
         # Search input
         self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("搜索PicACG漫画...")
+        self.search_bar.setPlaceholderText(strings.SEARCH_PLACEHOLDER)
         self.search_bar.setFixedHeight(40)
         self.search_bar.returnPressed.connect(self._on_search_triggered)
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                background-color: #1e1e1e;
-                border: 1px solid #3a3a3a;
-                border-radius: 8px;
-                padding: 0 15px;
-                color: #ffffff;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0078d4;
-            }
-        """)
+        self.search_bar.setObjectName("searchBar")
         
         # Search button
-        self.search_button = QPushButton("搜索")
+        self.search_button = QPushButton(strings.SEARCH)
         self.search_button.setFixedSize(80, 40)
         self.search_button.clicked.connect(self._on_search_triggered)
-        self.search_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                border: none;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1084d8;
-            }
-            QPushButton:pressed {
-                background-color: #006cbd;
-            }
-        """)
+        self.search_button.setObjectName("searchButton")
         
         # Settings button
-        settings_btn = QPushButton("设置")
+        settings_btn = QPushButton(strings.SETTINGS)
         settings_btn.setFixedSize(60, 40)
-        settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #555555;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #666666;
-            }
-            QPushButton:pressed {
-                background-color: #444444;
-            }
-        """)
+        settings_btn.setObjectName("settingsButton")
         settings_btn.clicked.connect(self._navigate_to_settings)
         
         # Login status
-        self.login_status = QLabel("未登录")
-        self.login_status.setStyleSheet("color: #ff4444; font-weight: bold; margin-left: 20px;")
+        self.login_status = QLabel(strings.NOT_LOGGED_IN)
+        self.login_status.setObjectName("loginStatus")
         
         layout.addWidget(self.search_bar)
         layout.addWidget(self.search_button)
@@ -190,7 +672,7 @@ class PicACGPage(QWidget):
     def _create_results_panel(self) -> QWidget:
         """Create left panel for search results."""
         self.results_panel = QWidget()
-        self.results_panel.setStyleSheet("background-color: #1e1e1e;")
+        self.results_panel.setObjectName("resultsPanel")
         
         layout = QVBoxLayout(self.results_panel)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -198,72 +680,48 @@ class PicACGPage(QWidget):
         
         # Results header
         header_layout = QHBoxLayout()
-        self.results_label = QLabel("搜索结果")
-        self.results_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.results_label = QLabel(strings.RESULTS)
+        self.results_label.setObjectName("resultsLabel")
         header_layout.addWidget(self.results_label)
         header_layout.addStretch()
         layout.addLayout(header_layout)
         
-        # Results scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-        
-        # Results container
-        self.results_container = QWidget()
-        self.results_layout = QVBoxLayout(self.results_container)
-        self.results_layout.setContentsMargins(0, 0, 0, 0)
-        self.results_layout.setSpacing(5)
-        self.results_layout.addStretch()
-        
-        scroll.setWidget(self.results_container)
-        layout.addWidget(scroll)
+        # Results list: cards are painted by the delegate, only for visible rows
+        self.results_model = _ComicListModel(self)
+        self.results_delegate = _ComicCardDelegate(self._request_thumbnail, self._failed_thumbs, self)
+        self.results_view = QListView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setItemDelegate(self.results_delegate)
+        self.results_view.setUniformItemSizes(True)
+        self.results_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.results_view.setSelectionMode(QListView.NoSelection)
+        self.results_view.setMouseTracking(True)
+        self.results_view.viewport().setCursor(Qt.PointingHandCursor)
+        self.results_view.setObjectName("resultsView")
+        self.results_view.clicked.connect(
+            lambda index: self._on_comic_selected(self.results_model.comic_at(index.row()))
+        )
+        layout.addWidget(self.results_view)
         
         # Pagination controls
         pagination_layout = QHBoxLayout()
         
-        self.prev_button = QPushButton("上一页")
+        self.prev_button = QPushButton(strings.PREV_PAGE)
+        self.prev_button.setObjectName("prevButton")
         self.prev_button.setFixedHeight(32)
         self.prev_button.clicked.connect(self._on_prev_page)
         self.prev_button.setEnabled(False)
         
-        self.page_label = QLabel("第 1 页")
+        self.page_label = QLabel(strings.FIRST_PAGE)
         self.page_label.setAlignment(Qt.AlignCenter)
-        self.page_label.setStyleSheet("color: #ffffff;")
+        self.page_label.setObjectName("pageLabel")
         
-        self.next_button = QPushButton("下一页")
+        self.next_button = QPushButton(strings.NEXT_PAGE)
+        self.next_button.setObjectName("nextButton")
         self.next_button.setFixedHeight(32)
         self.next_button.clicked.connect(self._on_next_page)
         self.next_button.setEnabled(False)
         
-        for btn in [self.prev_button, self.next_button]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3a3a3a;
-                    border: none;
-                    border-radius: 4px;
-                    color: #ffffff;
-                    padding: 0 20px;
-                }
-                QPushButton:hover:enabled {
-                    background-color: #4a4a4a;
-                }
-                QPushButton:disabled {
-                    color: #666666;
-                }
-            """)
-        
         pagination_layout.addWidget(self.prev_button)
         pagination_layout.addStretch()
         pagination_layout.addWidget(self.page_label)
@@ -277,21 +735,16 @@ class PicACGPage(QWidget):
     def _create_details_panel(self) -> QWidget:
         """Create right panel for comic details."""
         self.details_panel = QWidget()
-        self.details_panel.setStyleSheet("background-color: #252525;")
+        self.details_panel.setObjectName("detailsPanel")
         
         layout = QVBoxLayout(self.details_panel)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
         
         # Placeholder message
-        self.details_placeholder = QLabel("← 选择一个漫画查看详情")
+        self.details_placeholder = QLabel(strings.DETAILS_PLACEHOLDER)
         self.details_placeholder.setAlignment(Qt.AlignCenter)
-        self.details_placeholder.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 14px;
-            }
-        """)
+        self.details_placeholder.setObjectName("detailsPlaceholder")
         layout.addWidget(self.details_placeholder)
         
         # Details content (hidden initially)
@@ -305,24 +758,13 @@ class PicACGPage(QWidget):
         self.cover_label = QLabel()
         self.cover_label.setFixedSize(200, 267)  # 3:4 ratio
         self.cover_label.setAlignment(Qt.AlignCenter)
-        self.cover_label.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-            }
-        """)
+        self.cover_label.setObjectName("coverLabel")
         details_layout.addWidget(self.cover_label, 0, Qt.AlignHCenter)
         
         # Title
         self.title_label = QLabel()
         self.title_label.setWordWrap(True)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 16px;
-                font-weight: bold;
-            }
-        """)
+        self.title_label.setObjectName("titleLabel")
         details_layout.addWidget(self.title_label)
         
         # Info grid
@@ -336,7 +778,7 @@ class PicACGPage(QWidget):
         self.chapters_label = QLabel()
         
         for label in [self.author_label, self.category_label, self.id_label, self.chapters_label]:
-            label.setStyleSheet("color: #cccccc; font-size: 13px;")
+            label.setProperty("role", "info")
             label.setWordWrap(True)
             info_layout.addWidget(label)
         
@@ -346,65 +788,31 @@ class PicACGPage(QWidget):
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(10)
         
-        self.read_button = QPushButton("阅读")
+        self.read_button = QPushButton(strings.READ)
         self.read_button.setFixedHeight(40)
-        self.read_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                border: none;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #1084d8; }
-            QPushButton:pressed { background-color: #006cbd; }
-        """)
+        self.read_button.setObjectName("readButton")
         self.read_button.clicked.connect(self._on_read_clicked)
         buttons_layout.addWidget(self.read_button)
         
-        self.download_button = QPushButton("下载")
+        self.download_button = QPushButton(strings.DOWNLOAD)
         self.download_button.setFixedHeight(40)
-        self.download_button.setStyleSheet("""
-            QPushButton {
-                background-color: #107c10;
-                border: none;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #0e6b0e; }
-            QPushButton:pressed { background-color: #0c5a0c; }
-        """)
+        self.download_button.setObjectName("downloadButton")
         self.download_button.clicked.connect(self._on_download_clicked)
         buttons_layout.addWidget(self.download_button)
         
-        self.queue_button = QPushButton("加入队列")
+        self.queue_button = QPushButton(strings.ADD_TO_QUEUE)
         self.queue_button.setFixedHeight(40)
-        self.queue_button.setStyleSheet("""
-            QPushButton {
-                background-color: #5c2d91;
-                border: none;
-                border-radius: 8px;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #6b3fa0; }
-            QPushButton:pressed { background-color: #4a2373; }
-        """)
+        self.queue_button.setObjectName("queueButton")
         self.queue_button.clicked.connect(self._on_add_to_queue_clicked)
         buttons_layout.addWidget(self.queue_button)
         
         details_layout.addLayout(buttons_layout)
         
         # Chapter buttons container (will be populated when chapters load)
-        self.chapter_buttons_container = QWidget()
-        self.chapter_buttons_layout = QVBoxLayout(self.chapter_buttons_container)
-        self.chapter_buttons_layout.setContentsMargins(0, 10, 0, 0)
-        self.chapter_buttons_layout.setSpacing(5)
-        details_layout.addWidget(self.chapter_buttons_container)
+        self.chapter_grid = _ChapterGrid()
+        self.chapter_grid.chapter_clicked.connect(self._on_chapter_button_clicked)
+        self.chapter_grid.hide()
+        details_layout.addWidget(self.chapter_grid)
         
         details_layout.addStretch()
         
@@ -430,7 +838,7 @@ class PicACGPage(QWidget):
             return
         
         if not self.adapter.is_logged_in():
-            QMessageBox.warning(self, "搜索错误", "请先在设置中登录PicACG账号")
+            QMessageBox.warning(self, strings.SEARCH_ERROR, strings.LOGIN_REQUIRED)
             return
         
         self._current_keyword = keyword
@@ -439,18 +847,69 @@ class PicACGPage(QWidget):
     
     def _perform_search(self) -> None:
         """Perform search with current keyword and page."""
+        key = (self._current_keyword, self._current_page)
+        self._search_key = key
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            # Deliver like a real reply, after the caller has returned
+            QTimer.singleShot(0, lambda: self._show_search_results(key, cached))
+            return
+        
         self.search_button.setEnabled(False)
-        self.results_label.setText("搜索中...")
-        self.adapter.search(self._current_keyword, self._current_page)
+        self.results_label.setText(strings.SEARCHING)
+        
+        # Replies do not say which search they answer, so only one is sent at a time;
+        # a newer search is sent once the running one returns
+        if self._pending_search is None:
+            self._send_search(key)
+    
+    def _send_search(self, key: Tuple[str, int]) -> None:
+        """Ask the adapter for one (keyword, page)."""
+        self._pending_search = key
+        self.adapter.search(*key)
+    
+    def _resume_search(self) -> None:
+        """Send the search the user started while an older one was running."""
+        if self._search_key not in self._search_cache:
+            self._send_search(self._search_key)
     
     def _on_search_completed(self, comics: List[Comic]) -> None:
         """Handle search completion."""
+        key, self._pending_search = self._pending_search, None
+        if key is None:
+            return
+        
+        self._search_cache[key] = comics
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > self._SEARCH_CACHE_MAX:
+            self._search_cache.popitem(last=False)
+        
+        # Results of a search the user already replaced are cached but not shown
+        if key != self._search_key:
+            self._resume_search()
+            return
+        
+        self._show_search_results(key, comics)
+    
+    def _show_search_results(self, key: Tuple[str, int], comics: List[Comic]) -> None:
+        """
+        Display the results of one search.
+        
+        Args:
+            key: (keyword, page) the results belong to
+            comics: Found comics
+        """
+        if key != self._search_key:
+            return
+        
         self.search_button.setEnabled(True)
         self._all_comics = comics
         self._total_results = len(comics)
+        self._total_pages = (self._total_results + self._results_per_page - 1) // self._results_per_page
         
         # Update results label
-        self.results_label.setText(f"搜索结果 ({self._total_results} 个)")
+        self.results_label.setText(strings.RESULTS_COUNT.format(count=self._total_results))
         
         # Display current page
         self._display_current_page()
@@ -460,243 +919,110 @@ class PicACGPage(QWidget):
     
     def _on_search_failed(self, error: str) -> None:
         """Handle search failure with user-friendly message."""
+        key, self._pending_search = self._pending_search, None
+        if key is not None and key != self._search_key:
+            self._resume_search()
+            return
+        
         self.search_button.setEnabled(True)
-        self.results_label.setText("搜索失败")
+        self.results_label.setText(strings.SEARCH_FAILED)
         
         # Provide user-friendly error message
-        if "认证" in error or "login" in error.lower():
-            QMessageBox.warning(
-                self,
-                "认证失败",
-                "登录状态已过期，请重新登录。\n\n"
-                "请到设置页面重新登录PicACG账号。"
-            )
-        elif "网络" in error or "timeout" in error.lower():
-            QMessageBox.warning(
-                self,
-                "网络错误",
-                "网络连接超时或不稳定。\n\n"
-                "建议解决方案：\n"
-                "• 检查网络连接\n"
-                "• 在设置中切换API服务器\n"
-                "• 稍后重试"
-            )
-        else:
-            QMessageBox.warning(
-                self,
-                "搜索失败",
-                f"搜索时发生错误：{error}\n\n"
-                "请检查网络连接或稍后重试。"
-            )
+        self._show_error(error, _SEARCH_ERROR_DIALOGS, strings.SEARCH_FAILED, strings.SEARCH_ERROR_DETAIL)
+    
+    def _show_error(self, error: str, dialogs: Tuple[Tuple[str, str, str], ...], title: str, detail: str) -> None:
+        """
+        Show a warning dialog for an adapter error.
+        
+        Args:
+            error: Error message from the adapter
+            dialogs: (kind, title, message) this slot explains, in priority order
+            title: Dialog title for other errors
+            detail: Message template for other errors, formatted with the error
+        """
+        dialog = _classify_error(error, dialogs)
+        if dialog is None:
+            dialog = (title, detail.format(error=error))
+        QMessageBox.warning(self, *dialog)
     
     def _display_current_page(self) -> None:
         """Display comics for current page."""
-        # Clear existing results
-        while self.results_layout.count() > 1:
-            item = self.results_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
         # Calculate page range
         start_idx = (self._current_page - 1) * self._results_per_page
         end_idx = min(start_idx + self._results_per_page, self._total_results)
         
-        # Display comics for this page
-        for i in range(start_idx, end_idx):
-            comic = self._all_comics[i]
-            card = self._create_result_card(comic)
-            self.results_layout.insertWidget(i - start_idx, card)
-    
-    def _create_result_card(self, comic: Comic) -> QWidget:
-        """Create a result card widget."""
-        # Get theme colors
-        if self._current_theme == 'light':
-            bg_card = '#FAFAFA'
-            bg_card_hover = '#F0F0F0'
-            text_primary = '#000000'
-            text_secondary = '#333333'
-            border_color = '#E0E0E0'
-            border_hover = '#CCCCCC'
-            thumb_bg = '#F3F3F3'
-        else:
-            bg_card = '#2b2b2b'
-            bg_card_hover = '#3a3a3a'
-            text_primary = '#ffffff'
-            text_secondary = '#cccccc'
-            border_color = '#3a3a3a'
-            border_hover = '#4a4a4a'
-            thumb_bg = '#1e1e1e'
-        
-        card = QFrame()
-        card.setFixedHeight(80)
-        card.setCursor(Qt.PointingHandCursor)
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg_card};
-                border-radius: 8px;
-                border: 1px solid {border_color};
-            }}
-            QFrame:hover {{
-                background-color: {bg_card_hover};
-                border: 1px solid {border_hover};
-            }}
-        """)
-        
-        layout = QHBoxLayout(card)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(15)
+        # Retry thumbnails that failed on an earlier page
+        self._failed_thumbs.clear()
+        self.results_model.set_comics(self._all_comics[start_idx:end_idx])
+        self.results_view.scrollToTop()
         
-        # Thumbnail
-        thumb = QLabel()
-        thumb.setFixedSize(45, 60)
-        thumb.setAlignment(Qt.AlignCenter)
-        thumb.setStyleSheet(f"""
-            QLabel {{
-                background-color: {thumb_bg};
-                border-radius: 4px;
-                color: #666666;
-            }}
-        """)
-        thumb.setText("...")
-        layout.addWidget(thumb)
-        
-        # Load thumbnail asynchronously
-        self._load_thumbnail(thumb, comic.cover_url)
-        
-        # Info container
-        info_widget = QWidget()
-        info_widget.setMinimumWidth(200)  # Ensure minimum width for text
-        info_layout = QVBoxLayout(info_widget)
-        info_layout.setContentsMargins(0, 5, 0, 5)
-        info_layout.setSpacing(8)
+        # Warm the cache for the next page, behind the visible thumbnails
+        for comic in self._all_comics[end_idx:end_idx + self._results_per_page]:
+            url = comic.cover_url
+            if url and not url.startswith('placeholder') and QPixmapCache.find(_thumbnail_key(url)) is None:
+                self._load_thumbnail(url, priority=-1)
+    
+    def _request_thumbnail(self, url: str) -> None:
+        """Queue a thumbnail painted without its image for a delayed fetch."""
+        self._pending_thumbs.add(url)
+        if not self._thumb_timer.isActive():
+            self._thumb_timer.start()
+    
+    def _flush_pending_thumbs(self) -> None:
+        """Fetch the queued thumbnails whose cards are still in the viewport."""
+        pending, self._pending_thumbs = self._pending_thumbs, set()
+        viewport = self.results_view.viewport().rect()
+        
+        for row in range(self.results_model.rowCount()):
+            index = self.results_model.index(row)
+            url = index.data(_ComicListModel.CoverRole)
+            if url in pending and viewport.intersects(self.results_view.visualRect(index)):
+                self._load_thumbnail(url)
+    
+    def _load_thumbnail(self, url: str, priority: int = 0) -> None:
+        """
+        Load thumbnail image for a result card.
         
-        # Title
-        title = QLabel(comic.title)
-        title.setStyleSheet(f"""
-            QLabel {{
-                color: {text_primary};
-                font-weight: bold;
-                font-size: 14px;
-                background-color: transparent;
-            }}
-        """)
-        title.setWordWrap(True)
-        title.setMaximumHeight(36)  # Allow for 2 lines
-        title.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        
-        # Author
-        author = QLabel(f"作者: {comic.author}")
-        author.setStyleSheet(f"""
-            QLabel {{
-                color: {text_secondary};
-                font-size: 12px;
-                background-color: transparent;
-            }}
-        """)
-        author.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        
-        info_layout.addWidget(title)
-        info_layout.addWidget(author)
-        info_layout.addStretch()
-        
-        layout.addWidget(info_widget, 1)
-        
-        # Make card clickable
-        card.mousePressEvent = lambda e: self._on_comic_selected(comic)
-        
-        return card
-    
-    def _load_thumbnail(self, label: QLabel, url: str) -> None:
-        """Load thumbnail image for result card."""
-        if not url or url.startswith('placeholder'):
-            label.setText("无图")
-            label.setStyleSheet("""
-                QLabel {
-                    background-color: #1e1e1e;
-                    border-radius: 4px;
-                    color: #666666;
-                    font-size: 10px;
-                }
-            """)
+        Args:
+            url: Cover URL
+            priority: Thread pool priority, negative for background prefetch
+        """
+        if url in self._inflight_thumbs or url in self._failed_thumbs:
             return
         
-        # Use QThread to download thumbnail
-        from PySide6.QtCore import QThread, QObject, Signal
-        from PySide6.QtGui import QPixmap
-        import requests
+        # Scale a cover downloaded for the details panel instead of fetching it again
+        cached = QPixmapCache.find(url)
+        if cached is not None:
+            QPixmapCache.insert(
+                _thumbnail_key(url),
+                cached.scaled(45, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            )
+            self.results_model.cover_changed(url)
+            return
         
-        class ThumbnailLoader(QObject):
-            finished = Signal(object)  # QPixmap or None
-            
-            def __init__(self, url):
-                super().__init__()
-                self.url = url
-            
-            def load(self):
-                try:
-                    # Use proper headers for PicACG image servers
-                    headers = {
-                        'User-Agent': 'okhttp/3.8.1',
-                        'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                    }
-                    
-                    response = requests.get(self.url, headers=headers, timeout=8, verify=False)
-                    if response.status_code == 200:
-                        pixmap = QPixmap()
-                        if pixmap.loadFromData(response.content):
-                            self.finished.emit(pixmap)
-                        else:
-                            self.finished.emit(None)
-                    else:
-                        print(f"Thumbnail HTTP {response.status_code} for {self.url}")
-                        self.finished.emit(None)
-                except Exception as e:
-                    print(f"Thumbnail load error for {self.url}: {e}")
-                    self.finished.emit(None)
-        
-        def on_loaded(pixmap):
-            if pixmap and not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    45, 60,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                label.setPixmap(scaled)
-                label.setStyleSheet("""
-                    QLabel {
-                        background-color: #1e1e1e;
-                        border-radius: 4px;
-                    }
-                """)
-            else:
-                label.setText("×")
-                label.setStyleSheet("""
-                    QLabel {
-                        background-color: #1e1e1e;
-                        border-radius: 4px;
-                        color: #666666;
-                        font-size: 12px;
-                    }
-                """)
-        
-        # Create and start thread
-        thread = QThread()
-        loader = ThumbnailLoader(url)
-        loader.moveToThread(thread)
-        
-        thread.started.connect(loader.load)
-        loader.finished.connect(on_loaded)
-        loader.finished.connect(thread.quit)
-        
-        thread.start()
-        
-        # Store references to prevent garbage collection
-        if not hasattr(self, '_thumbnail_threads'):
-            self._thumbnail_threads = []
-        self._thumbnail_threads.append((thread, loader))
+        self._inflight_thumbs.add(url)
+        task = ImageTask(url, (45, 60), self._thumbnail_signals, disk_cache=self._image_disk_cache)
+        self._thumbnail_pool.start(task, priority)
+    
+    def _on_thumbnail_loaded(self, url: str, decoded: Optional[Tuple[bytes, int, int, int]]) -> None:
+        """Cache a downloaded thumbnail and repaint the cards showing it."""
+        self._inflight_thumbs.discard(url)
+        
+        if decoded is not None:
+            QPixmapCache.insert(_thumbnail_key(url), pixmap_from_rgb(decoded))
+        else:
+            self._failed_thumbs.add(url)
+        
+        self.results_model.cover_changed(url)
     
     def _on_comic_selected(self, comic: Comic) -> None:
         """Handle comic selection."""
+        # Clicking the comic already shown changes nothing while its chapters are
+        # loaded or loading; after a failed load the click retries
+        if (self._selected_comic is not None and self._selected_comic.id == comic.id
+                and (comic.id in self._chapters_cache or comic.id in self._chapters_inflight)):
+            return
+        
         self._selected_comic = comic
         
         # Hide placeholder, show details
@@ -705,164 +1031,123 @@ class PicACGPage(QWidget):
         
         # Update details
         self.title_label.setText(comic.title)
-        self.author_label.setText(f"作者: {comic.author}")
-        self.category_label.setText(f"分类: {', '.join(comic.categories)}")
+        self.author_label.setText(strings.AUTHOR.format(author=comic.author))
+        self.category_label.setText(strings.CATEGORY.format(categories=', '.join(comic.categories)))
         self.id_label.setText(f"ID: {comic.id}")
-        self.chapters_label.setText("章节: 加载中...")
+        self.chapters_label.setText(strings.CHAPTERS_LOADING)
         
-        # Clear existing chapter buttons
-        while self.chapter_buttons_layout.count():
-            item = self.chapter_buttons_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Clear chapters of the previous comic
+        self._comic_chapters = []
+        self._comic_chapters_sorted = []
+        self._create_chapter_buttons([], [])
         
         # Load cover
         self._load_cover(comic.cover_url)
         
         # Load chapters
-        self.adapter.get_chapters(comic.id)
+        cached = self._chapters_cache.get(comic.id)
+        if cached is not None:
+            self._chapters_cache.move_to_end(comic.id)
+            self._on_chapters_loaded(cached[0])
+        elif comic.id not in self._chapters_inflight:
+            # Otherwise the running request fills the grid when it returns
+            self._chapters_inflight.add(comic.id)
+            self.adapter.get_chapters(comic.id)
     
     def _load_cover(self, url: str) -> None:
         """Load cover image from URL."""
+        self._cover_url = url
+        
         if not url or url.startswith('placeholder'):
-            self.cover_label.setText("无封面")
+            self.cover_label.setText(strings.NO_COVER)
             return
         
-        self.cover_label.setText("加载中...")
+        cached = QPixmapCache.find(url)
+        if cached is not None:
+            self._set_cover(cached)
+            return
         
-        # Use QThread to download image with proper headers
-        from PySide6.QtCore import QThread, QObject, Signal
-        from PySide6.QtGui import QPixmap
-        import requests
+        self.cover_label.setText(strings.LOADING)
         
-        class ImageLoader(QObject):
-            finished = Signal(object)  # QPixmap or None
-            
-            def __init__(self, url):
-                super().__init__()
-                self.url = url
-            
-            def load(self):
-                try:
-                    # Use proper headers for PicACG image servers
-                    headers = {
-                        'User-Agent': 'okhttp/3.8.1',
-                        'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                    }
-                    
-                    response = requests.get(self.url, headers=headers, timeout=15, verify=False)
-                    if response.status_code == 200:
-                        pixmap = QPixmap()
-                        if pixmap.loadFromData(response.content):
-                            self.finished.emit(pixmap)
-                        else:
-                            print(f"Failed to decode cover image from {self.url}")
-                            self.finished.emit(None)
-                    else:
-                        print(f"Cover HTTP {response.status_code} for {self.url}")
-                        self.finished.emit(None)
-                except Exception as e:
-                    print(f"Failed to load cover from {self.url}: {e}")
-                    self.finished.emit(None)
-        
-        def on_image_loaded(pixmap):
-            if pixmap and not pixmap.isNull():
-                # Scale to fit
-                scaled = pixmap.scaled(
-                    200, 267,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                self.cover_label.setPixmap(scaled)
-            else:
-                self.cover_label.setText("加载失败")
-            
-            # Clean up
-            if hasattr(self, '_image_thread'):
-                self._image_thread.quit()
-                self._image_thread.wait()
+        # Same cover already downloading (e.g. quick back-and-forth clicks), just wait for it
+        if url in self._inflight_covers:
+            return
         
-        # Create thread
-        self._image_thread = QThread()
-        self._image_loader = ImageLoader(url)
-        self._image_loader.moveToThread(self._image_thread)
+        # Covers jump ahead of queued thumbnails
+        self._inflight_covers.add(url)
+        task = ImageTask(url, (200, 267), self._cover_signals, timeout=15, disk_cache=self._image_disk_cache)
+        self._thumbnail_pool.start(task, 1)
+    
+    def _on_cover_loaded(self, url: str, decoded: Optional[Tuple[bytes, int, int, int]]) -> None:
+        """Cache a downloaded cover and show it if its comic is still selected."""
+        self._inflight_covers.discard(url)
         
-        # Connect signals
-        self._image_thread.started.connect(self._image_loader.load)
-        self._image_loader.finished.connect(on_image_loaded)
+        pixmap = pixmap_from_rgb(decoded) if decoded is not None else None
+        if pixmap is not None:
+            QPixmapCache.insert(url, pixmap)
         
-        # Start thread
-        self._image_thread.start()
+        if url != self._cover_url:
+            return
+        
+        if pixmap is not None:
+            self._set_cover(pixmap)
+        else:
+            self.cover_label.setText(strings.LOAD_FAILED)
+    
+    def _set_cover(self, pixmap: QPixmap) -> None:
+        """Show a downloaded cover (already decoded to fit) in the details panel."""
+        self.cover_label.setPixmap(pixmap)
     
     def _on_chapters_loaded(self, chapters: List[Chapter]) -> None:
         """Handle chapters loaded."""
-        print(f"Chapters loaded: {len(chapters)} chapters")
-        for i, chapter in enumerate(chapters):
-            print(f"  Chapter {i+1}: {chapter.title} (ID: {chapter.id})")
+        _logger.debug("Chapters loaded: %d chapters", len(chapters))
+        if _logger.isEnabledFor(logging.DEBUG):
+            for i, chapter in enumerate(chapters):
+                _logger.debug("  Chapter %d: %s (ID: %s)", i + 1, chapter.title, chapter.id)
+        
+        comic_id = chapters[0].comic_id if chapters else None
+        if comic_id:
+            self._chapters_inflight.discard(comic_id)
+        else:
+            # An empty list does not say which request it answers
+            self._chapters_inflight.clear()
+        
+        # Sort and format once per chapter list; revisiting a comic reuses both
+        entry = self._chapters_cache.get(comic_id) if comic_id else None
+        if entry is None or entry[0] is not chapters:
+            ascending = sorted(chapters, key=attrgetter('chapter_number'))
+            labels = [strings.CHAPTER_BUTTON.format(number=c.chapter_number) for c in ascending]
+            entry = (chapters, ascending, labels)
+        
+        if comic_id:
+            self._chapters_cache[comic_id] = entry
+            self._chapters_cache.move_to_end(comic_id)
+            if len(self._chapters_cache) > self._CHAPTERS_CACHE_MAX:
+                self._chapters_cache.popitem(last=False)
+            
+            # Chapters of a comic the user already clicked away from
+            if self._selected_comic is None or self._selected_comic.id != comic_id:
+                return
         
-        self._comic_chapters = chapters
-        self.chapters_label.setText(f"章节: {len(chapters)} 话")
+        self._comic_chapters, self._comic_chapters_sorted, labels = entry
+        self.chapters_label.setText(strings.CHAPTERS_COUNT.format(count=len(chapters)))
         
         # Create chapter buttons
-        self._create_chapter_buttons(chapters)
+        self._create_chapter_buttons(self._comic_chapters_sorted, labels)
     
-    def _create_chapter_buttons(self, chapters: List[Chapter]) -> None:
-        """Create chapter selection buttons."""
-        # Clear existing buttons
-        while self.chapter_buttons_layout.count():
-            item = self.chapter_buttons_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        if not chapters or len(chapters) <= 1:
-            return
-        
-        # Get theme colors
-        if self._current_theme == 'light':
-            btn_bg, btn_text = '#E0E0E0', '#333333'
-        else:
-            btn_bg, btn_text = '#3a3a3a', '#cccccc'
-        
-        btn_style = f"""
-            QLabel {{
-                background-color: {btn_bg};
-                color: {btn_text};
-                padding: 4px 8px;
-                border-radius: 4px;
-                font-size: 11px;
-            }}
-            QLabel:hover {{
-                background-color: #0078d4;
-                color: #ffffff;
-            }}
+    def _create_chapter_buttons(self, chapters: List[Chapter], labels: List[str]) -> None:
         """
+        Show chapter selection buttons (none for single-chapter comics).
         
-        # Sort chapters by chapter_number (ascending order for display)
-        sorted_chapters = sorted(chapters, key=lambda c: c.chapter_number)
-        
-        # Create rows of buttons (6 per row)
-        BUTTONS_PER_ROW = 6
-        current_row = None
-        current_row_layout = None
-        
-        for i, chapter in enumerate(sorted_chapters):
-            if i % BUTTONS_PER_ROW == 0:
-                current_row = QWidget()
-                current_row_layout = QHBoxLayout(current_row)
-                current_row_layout.setContentsMargins(0, 0, 0, 0)
-                current_row_layout.setSpacing(4)
-                current_row_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-                self.chapter_buttons_layout.addWidget(current_row)
-            
-            btn = QLabel(f"第{chapter.chapter_number}话")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(btn_style)
-            btn.mousePressEvent = lambda e, ch=chapter: self._on_chapter_button_clicked(ch)
-            current_row_layout.addWidget(btn)
+        Args:
+            chapters: Chapters sorted by chapter_number
+            labels: Button text of each chapter
+        """
+        if not chapters or len(chapters) <= 1:
+            chapters, labels = [], []
         
-        # Add stretch to last row
-        if current_row_layout:
-            current_row_layout.addStretch()
+        self.chapter_grid.set_chapters(chapters, labels)
+        self.chapter_grid.setVisible(bool(chapters))
     
     def _on_chapter_button_clicked(self, chapter: Chapter) -> None:
         """Handle chapter button click - start reading that chapter."""
@@ -871,134 +1156,54 @@ class PicACGPage(QWidget):
     
     def _on_chapters_failed(self, error: str) -> None:
         """Handle chapters load failure with user-friendly message."""
-        print(f"Chapters load failed: {error}")
-        self.chapters_label.setText("章节: 加载失败")
+        _logger.warning("Chapters load failed: %s", error)
+        self.chapters_label.setText(strings.CHAPTERS_FAILED)
+        # The error does not say which comic failed, so let every pending one be retried
+        self._chapters_inflight.clear()
         
         # Provide user-friendly error message
-        if "认证" in error or "login" in error.lower():
-            QMessageBox.warning(
-                self,
-                "认证失败",
-                "登录状态已过期，请重新登录。\n\n"
-                "请到设置页面重新登录PicACG账号。"
-            )
-        elif "500" in error:
-            QMessageBox.warning(
-                self,
-                "服务器错误", 
-                "服务器返回错误，无法加载章节列表。\n\n"
-                "建议解决方案：\n"
-                "• 稍后重试\n"
-                "• 在设置中切换API服务器\n"
-                "• 尝试其他漫画"
-            )
-        else:
-            QMessageBox.warning(
-                self,
-                "章节加载失败",
-                f"无法加载章节列表：{error}\n\n"
-                "请稍后重试或尝试其他漫画。"
-            )
+        self._show_error(error, _CHAPTERS_ERROR_DIALOGS, strings.CHAPTERS_LOAD_FAILED, strings.CHAPTERS_ERROR_DETAIL)
     
     def _on_images_loaded(self, images: List[str]) -> None:
         """Handle images load completion."""
-        print(f"Images loaded: {len(images)} images")
+        _logger.debug("Images loaded: %d images", len(images))
         # Images are loaded successfully, reader can proceed
         # This is mainly for logging, the actual reading is handled by the reader component
     
     def _on_images_failed(self, error: str) -> None:
         """Handle images load failure with user-friendly message."""
-        print(f"Images load failed: {error}")
+        _logger.warning("Images load failed: %s", error)
         
         # Provide user-friendly error message with suggestions
-        if "所有API服务器都无法获取此漫画的图片" in error:
-            QMessageBox.warning(
-                self, 
-                "图片加载失败", 
-                "无法加载此漫画的图片。\n\n"
-                "可能的原因：\n"
-                "• 此漫画在服务器上暂时不可用\n"
-                "• 网络连接问题\n"
-                "• 服务器维护中\n\n"
-                "建议解决方案：\n"
-                "• 尝试其他漫画\n"
-                "• 稍后重试\n"
-                "• 在设置中切换API服务器\n"
-                "• 检查网络连接"
-            )
-        elif "500" in error:
-            QMessageBox.warning(
-                self,
-                "服务器错误",
-                "服务器返回错误，请稍后重试。\n\n"
-                "如果问题持续存在，请尝试：\n"
-                "• 在设置中切换到其他API服务器\n"
-                "• 尝试阅读其他漫画"
-            )
-        elif "认证" in error or "login" in error.lower():
-            QMessageBox.warning(
-                self,
-                "认证失败", 
-                "登录状态已过期，请重新登录。\n\n"
-                "请到设置页面重新登录PicACG账号。"
-            )
-        else:
-            QMessageBox.warning(
-                self,
-                "图片加载失败",
-                f"无法加载图片：{error}\n\n"
-                "请稍后重试或尝试其他漫画。"
-            )
+        self._show_error(error, _IMAGES_ERROR_DIALOGS, strings.IMAGES_LOAD_FAILED, strings.IMAGES_ERROR_DETAIL)
     
     def _on_read_clicked(self) -> None:
         """Handle read button click."""
-        print(f"Read button clicked. Comic: {self._selected_comic is not None}, Chapters: {len(self._comic_chapters) if self._comic_chapters else 0}")
+        _logger.debug("Read button clicked. Comic: %s, Chapters: %d", self._selected_comic is not None, len(self._comic_chapters))
         
         if not self._selected_comic:
-            QMessageBox.warning(self, "阅读", "请先选择一个漫画")
+            QMessageBox.warning(self, strings.READ, strings.SELECT_COMIC_FIRST)
             return
         
         if not self._comic_chapters:
-            QMessageBox.warning(self, "阅读", "章节加载中，请稍后再试")
+            QMessageBox.warning(self, strings.READ, strings.CHAPTERS_NOT_READY)
             return
         
-        # 修复章节选择逻辑：PicACG章节是倒序排列的
-        # 需要选择正确的第一章
-        first_chapter = None
-        
-        if len(self._comic_chapters) == 1:
-            # 只有一章，直接选择
-            first_chapter = self._comic_chapters[0]
-        else:
-            # 多章节，检查顺序
-            first_order = self._comic_chapters[0].chapter_number
-            last_order = self._comic_chapters[-1].chapter_number
-            
-            if first_order > last_order:
-                # 倒序排列（PicACG的标准情况），选择最后一个作为第一章
-                first_chapter = self._comic_chapters[-1]
-                print(f"检测到倒序章节，选择索引 {len(self._comic_chapters)-1} 作为第一章")
-            else:
-                # 正序排列，选择第一个
-                first_chapter = self._comic_chapters[0]
-                print(f"检测到正序章节，选择索引 0 作为第一章")
-        
-        if first_chapter:
-            print(f"Selected first chapter: {first_chapter.title} (order: {first_chapter.chapter_number})")
-            self.read_requested.emit(self._selected_comic, first_chapter)
-        else:
-            QMessageBox.warning(self, "阅读", "无法确定第一章节")
+        # PicACG章节通常是倒序排列的，排序后的第一个就是第一章
+        first_chapter = self._comic_chapters_sorted[0]
+        _logger.debug("Selected first chapter: %s (order: %s)", first_chapter.title, first_chapter.chapter_number)
+        self.read_requested.emit(self._selected_comic, first_chapter)
     
     def _on_download_clicked(self) -> None:
         """Handle download button click."""
-        print(f"Download button clicked. Comic: {self._selected_comic is not None}, Chapters: {len(self._comic_chapters) if self._comic_chapters else 0}")
+        _logger.debug("Download button clicked. Comic: %s, Chapters: %d", self._selected_comic is not None, len(self._comic_chapters))
         
         if not self._selected_comic:
-            QMessageBox.warning(self, "下载", "请先选择一个漫画")
+            QMessageBox.warning(self, strings.DOWNLOAD, strings.SELECT_COMIC_FIRST)
             return
         
         if not self._comic_chapters:
-            QMessageBox.warning(self, "下载", "章节加载中，请稍后再试")
+            QMessageBox.warning(self, strings.DOWNLOAD, strings.CHAPTERS_NOT_READY)
             return
         
         # Emit signal to download all chapters
@@ -1007,11 +1212,11 @@ class PicACGPage(QWidget):
     def _on_add_to_queue_clicked(self) -> None:
         """Handle add to queue button click."""
         if not self._selected_comic:
-            QMessageBox.warning(self, "加入队列", "请先选择一个漫画")
+            QMessageBox.warning(self, strings.ADD_TO_QUEUE, strings.SELECT_COMIC_FIRST)
             return
         
         if not self._comic_chapters:
-            QMessageBox.warning(self, "加入队列", "章节加载中，请稍后再试")
+            QMessageBox.warning(self, strings.ADD_TO_QUEUE, strings.CHAPTERS_NOT_READY)
             return
         
         # Emit signal to add to queue
@@ -1026,33 +1231,41 @@ class PicACGPage(QWidget):
     
     def _on_next_page(self) -> None:
         """Handle next page button."""
-        total_pages = (self._total_results + self._results_per_page - 1) // self._results_per_page
-        if self._current_page < total_pages:
+        if self._current_page < self._total_pages:
             self._current_page += 1
             self._display_current_page()
             self._update_pagination()
     
     def _update_pagination(self) -> None:
         """Update pagination controls."""
-        total_pages = (self._total_results + self._results_per_page - 1) // self._results_per_page
+        state = (self._current_page, self._total_pages)
+        if state == self._pagination_state:
+            return
         
-        self.page_label.setText(f"第 {self._current_page} / {total_pages} 页")
+        self._pagination_state = state
+        self.page_label.setText(strings.PAGE_OF.format(page=self._current_page, total=self._total_pages))
         self.prev_button.setEnabled(self._current_page > 1)
-        self.next_button.setEnabled(self._current_page < total_pages)
+        self.next_button.setEnabled(self._current_page < self._total_pages)
     
     def _on_login_completed(self, success: bool, message: str) -> None:
         """Handle login completion."""
         if success:
-            self.login_status.setText("已登录")
-            self.login_status.setStyleSheet("color: #00aa00; font-weight: bold; margin-left: 20px;")
+            self._set_login_status(strings.LOGGED_IN, True)
         else:
-            self.login_status.setText("登录失败")
-            self.login_status.setStyleSheet("color: #ff4444; font-weight: bold; margin-left: 20px;")
+            self._set_login_status(strings.LOGIN_FAILED, False)
     
     def _on_login_failed(self, error: str) -> None:
         """Handle login failure."""
-        self.login_status.setText("未登录")
-        self.login_status.setStyleSheet("color: #ff4444; font-weight: bold; margin-left: 20px;")
+        self._set_login_status(strings.NOT_LOGGED_IN, False)
+    
+    def _set_login_status(self, text: str, logged_in: bool) -> None:
+        """Update the login status label; its color follows the loggedIn property."""
+        self.login_status.setText(text)
+        if self.login_status.property("loggedIn") != logged_in:
+            self.login_status.setProperty("loggedIn", logged_in)
+            # Property selectors are only re-evaluated on polish
+            self.login_status.style().unpolish(self.login_status)
+            self.login_status.style().polish(self.login_status)
     
     def _navigate_to_settings(self) -> None:
         """导航到设置页面的PicACG部分"""
@@ -1063,8 +1276,7 @@ class PicACGPage(QWidget):
         """Handle settings saved."""
         # Check if adapter is now logged in
         if self.adapter.is_logged_in():
-            self.login_status.setText("已登录")
-            self.login_status.setStyleSheet("color: #00aa00; font-weight: bold; margin-left: 20px;")
+            self._set_login_status(strings.LOGGED_IN, True)
         else:
             # Try auto-login with new settings
             self.adapter.auto_login()
@@ -1073,20 +1285,22 @@ class PicACGPage(QWidget):
         """检查并执行自动登录"""
         try:
             # 从全局应用获取配置管理器
+            # Imported here: core.app imports ui.main_window, which imports this page
             from pancomic.core.app import App
             app = App()
             if app and app.config_manager:
                 config_manager = app.config_manager
                 
-                # 检查自动登录设置
-                auto_login = config_manager.get('picacg.auto_login', False)
-                email = config_manager.get('picacg.email', '')
-                password = config_manager.get('picacg.password', '')
+                # 检查自动登录设置（一次取出整个picacg配置段）
+                picacg_config = config_manager.get('picacg', {})
+                auto_login = picacg_config.get('auto_login', False)
+                email = picacg_config.get('email', '')
+                password = picacg_config.get('password', '')
                 
-                print(f"🔍 自动登录检查: auto_login={auto_login}, email={email}, has_password={bool(password)}")
+                _logger.debug("自动登录检查: auto_login=%s, email=%s, has_password=%s", auto_login, email, bool(password))
                 
                 if auto_login and email and password:
-                    print(f"🔄 执行自动登录: {email}")
+                    _logger.info("执行自动登录: %s", email)
                     
                     # 更新适配器配置
                     self.adapter.config.update({
@@ -1102,12 +1316,12 @@ class PicACGPage(QWidget):
                     # 执行自动登录
                     self.adapter.auto_login()
                 else:
-                    print("ℹ️ 自动登录未启用或缺少凭据")
+                    _logger.debug("自动登录未启用或缺少凭据")
             else:
-                print("⚠️ 无法获取配置管理器，跳过自动登录")
+                _logger.warning("无法获取配置管理器，跳过自动登录")
                 
         except Exception as e:
-            print(f"❌ 自动登录检查失败: {e}")
+            _logger.error("自动登录检查失败: %s", e)
     
     def get_adapter(self) -> PicACGAdapter:
         """Get the PicACG adapter."""
@@ -1116,121 +1330,16 @@ class PicACGPage(QWidget):
 
     def apply_theme(self, theme: str) -> None:
         """Apply theme to PicACG page components."""
+        # Re-setting the same stylesheet would still re-polish every widget
+        if theme == self._current_theme:
+            return
         self._current_theme = theme  # Save current theme
         
-        if theme == 'light':
-            bg_primary = '#FFFFFF'
-            bg_secondary = '#F3F3F3'
-            bg_card = '#FAFAFA'
-            text_primary = '#000000'
-            text_secondary = '#333333'
-            text_muted = '#666666'
-            border_color = '#E0E0E0'
-            accent_color = '#0078D4'
-        else:
-            bg_primary = '#1e1e1e'
-            bg_secondary = '#2b2b2b'
-            bg_card = '#252525'
-            text_primary = '#ffffff'
-            text_secondary = '#cccccc'
-            text_muted = '#888888'
-            border_color = '#3a3a3a'
-            accent_color = '#0078d4'
-        
-        # Main page background
-        self.setStyleSheet(f"background-color: {bg_primary};")
-        
-        # Search container
-        if hasattr(self, 'search_container'):
-            self.search_container.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {bg_secondary};
-                    border-bottom: 1px solid {border_color};
-                }}
-            """)
-        
-        # Search bar
-        if hasattr(self, 'search_bar'):
-            self.search_bar.setStyleSheet(f"""
-                QLineEdit {{
-                    background-color: {bg_primary};
-                    border: 1px solid {border_color};
-                    border-radius: 8px;
-                    padding: 0 15px;
-                    color: {text_primary};
-                    font-size: 14px;
-                }}
-                QLineEdit:focus {{
-                    border: 1px solid {accent_color};
-                }}
-            """)
-        
-        # Results panel (left)
-        if hasattr(self, 'results_panel'):
-            self.results_panel.setStyleSheet(f"background-color: {bg_primary};")
-        
-        # Details panel (right)
-        if hasattr(self, 'details_panel'):
-            self.details_panel.setStyleSheet(f"background-color: {bg_card};")
-        
-        # Results label
-        if hasattr(self, 'results_label'):
-            self.results_label.setStyleSheet(f"color: {text_primary}; font-size: 14px; font-weight: bold;")
-        
-        # Page label
-        if hasattr(self, 'page_label'):
-            self.page_label.setStyleSheet(f"color: {text_primary};")
-        
-        # Details placeholder
-        if hasattr(self, 'details_placeholder'):
-            self.details_placeholder.setStyleSheet(f"color: {text_muted}; font-size: 16px;")
-        
-        # Title label
-        if hasattr(self, 'title_label'):
-            self.title_label.setStyleSheet(f"color: {text_primary}; font-size: 18px; font-weight: bold;")
-        
-        # Info labels
-        for attr in ['author_label', 'category_label', 'id_label', 'chapters_label']:
-            if hasattr(self, attr):
-                getattr(self, attr).setStyleSheet(f"color: {text_secondary}; font-size: 13px;")
-        
-        # Scroll area
-        if hasattr(self, 'results_scroll'):
-            self.results_scroll.setStyleSheet(f"""
-                QScrollArea {{
-                    border: none;
-                    background-color: {bg_primary};
-                }}
-                QScrollBar:vertical {{
-                    background-color: {bg_secondary};
-                    width: 12px;
-                }}
-                QScrollBar::handle:vertical {{
-                    background-color: {border_color};
-                    border-radius: 6px;
-                }}
-            """)
-        
-        # Navigation buttons
-        for attr in ['prev_button', 'next_button']:
-            if hasattr(self, attr):
-                getattr(self, attr).setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {border_color};
-                        color: {text_primary};
-                        border: none;
-                        border-radius: 4px;
-                        padding: 8px 16px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {text_muted};
-                    }}
-                    QPushButton:disabled {{
-                        background-color: {bg_secondary};
-                        color: {text_muted};
-                    }}
-                """)
-        
-        # Re-display search results with new theme
-        if self._all_comics:
-            self._display_current_page()
+        # One stylesheet for the whole page
+        self.setStyleSheet(_PAGE_QSS.get(theme, _PAGE_QSS['dark']))
+        
+        # Repaint result cards and chapter buttons with the new theme
+        self.results_delegate.theme = theme
+        self.results_view.viewport().update()
+        self.chapter_grid.theme = theme
+        self.chapter_grid.update()
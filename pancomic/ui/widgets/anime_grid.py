@@ -115,14 +115,7 @@ class AnimeGrid(QScrollArea):
             animes: List of Anime objects to display
         """
         for anime in animes:
-            card = AnimeCard(anime)
-            
-            # Connect signals
-            card.clicked.connect(lambda a=anime: self.anime_clicked.emit(a))
-            card.double_clicked.connect(lambda a=anime: self.anime_double_clicked.emit(a))
-            card.right_clicked.connect(lambda a=anime: self.anime_right_clicked.emit(a))
-            card.tag_include_requested.connect(self.tag_include_requested)
-            card.tag_exclude_requested.connect(self.tag_exclude_requested)
+            card = self._create_card(anime)
             
             # Add to layout using the current number of columns
             current_row = self.grid_layout.count() // self._current_columns
@@ -136,15 +129,64 @@ class AnimeGrid(QScrollArea):
         # Adjust columns after adding anime cards
         self._adjust_columns()
     
+    def _create_card(self, anime: Anime) -> AnimeCard:
+        """Create an anime card with its signals connected."""
+        card = AnimeCard(anime)
+        
+        # Connect signals (emit the card's current anime, it may be refreshed)
+        card.clicked.connect(lambda c=card: self.anime_clicked.emit(c.anime))
+        card.double_clicked.connect(lambda c=card: self.anime_double_clicked.emit(c.anime))
+        card.right_clicked.connect(lambda c=card: self.anime_right_clicked.emit(c.anime))
+        card.tag_include_requested.connect(self.tag_include_requested)
+        card.tag_exclude_requested.connect(self.tag_exclude_requested)
+        
+        return card
+    
+    @staticmethod
+    def _anime_key(anime: Anime) -> tuple:
+        """Identity of an anime for card reuse."""
+        return (anime.source, str(anime.id), anime.status)
+    
     def set_animes(self, animes: List[Anime]) -> None:
         """
         Replace current anime list with new list.
         
+        Cards for unchanged animes are kept; only removed or changed
+        animes have their cards destroyed and only new ones are created.
+        
         Args:
             animes: New list of Anime objects
         """
-        self.clear()
-        self.add_animes(animes)
+        # Index existing cards by anime identity
+        old_cards = {}
+        for card in self._anime_cards:
+            old_cards.setdefault(self._anime_key(card.anime), []).append(card)
+        
+        new_cards = []
+        for anime in animes:
+            candidates = old_cards.get(self._anime_key(anime))
+            card = candidates.pop(0) if candidates else None
+            if card is not None and card.anime != anime:
+                # Same anime but different data, rebuild its card
+                self.grid_layout.removeWidget(card)
+                card.deleteLater()
+                card = None
+            if card is None:
+                card = self._create_card(anime)
+            else:
+                card.anime = anime
+            new_cards.append(card)
+        
+        # Destroy cards whose animes are gone
+        for cards in old_cards.values():
+            for card in cards:
+                self.grid_layout.removeWidget(card)
+                card.deleteLater()
+        
+        self._anime_cards = new_cards
+        if new_cards:
+            self._rearrange_cards(self._current_columns)
+            self._adjust_columns()
     
     def clear(self) -> None:
         """Clear all anime cards from the grid."""
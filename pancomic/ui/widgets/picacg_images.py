@@ -0,0 +1,289 @@
+"""
+Image loading shared by the PicACG pages.
+
+Both pages download covers and thumbnails through the same keep-alive
+session, decode them off the GUI thread into RGB buffers and keep the
+encoded bytes in one persistent disk cache.
+"""
+
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Tuple
+import requests
+import urllib3
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, Slot, QSize, QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QPixmap, QImage, QImageReader
+
+from pancomic.infrastructure.cover_cache import CoverCache
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TURBO_JPEG = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # PyTurboJPEG or the libturbojpeg shared library is not available
+    _TURBO_JPEG = None
+
+# Only advertise the modern formats the installed Pillow can actually decode
+Image.init()
+_IMAGE_ACCEPT = ','.join(
+    [mime for fmt, mime in (('AVIF', 'image/avif'), ('WEBP', 'image/webp')) if fmt in Image.OPEN]
+    + ['image/apng', 'image/*;q=0.8', '*/*;q=0.5']
+)
+
+# Shared keep-alive session for thumbnail and cover downloads (see configure_session)
+IMAGE_SESSION = requests.Session()
+IMAGE_SESSION.headers.update({
+    'User-Agent': 'okhttp/3.8.1',
+    'Accept': _IMAGE_ACCEPT,
+    # urllib3 includes br/zstd only when brotli/zstandard is installed to decode them
+    'Accept-Encoding': urllib3.util.request.ACCEPT_ENCODING,
+})
+_IMAGE_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+IMAGE_SESSION.mount('https://', _IMAGE_ADAPTER)
+IMAGE_SESSION.mount('http://', _IMAGE_ADAPTER)
+
+# Child of the application logger, so level and handlers come from Logger.setup
+_logger = logging.getLogger('PanComic.picacg')
+
+# Process-wide disk cache, created by the first page that asks for it
+_cover_cache: Optional[CoverCache] = None
+
+
+def configure_session(verify_tls: bool) -> None:
+    """
+    Apply the PicACG TLS setting to the shared image session.
+    
+    Args:
+        verify_tls: Whether image downloads check server certificates; when
+            False, urllib3's InsecureRequestWarning is silenced as well
+    """
+    IMAGE_SESSION.verify = verify_tls
+    if not verify_tls:
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def cover_cache() -> Optional[CoverCache]:
+    """
+    Get the persistent image cache shared by the PicACG pages.
+    
+    The cache stays open for the lifetime of the process, so no page
+    closes it from under the other one.
+    
+    Returns:
+        The shared cache, or None if the database cannot be opened
+    """
+    global _cover_cache
+    if _cover_cache is None:
+        try:
+            _cover_cache = CoverCache(
+                str(Path.home() / '.cache' / 'pancomic' / 'covers.sqlite'),
+                max_size_mb=500
+            )
+        except Exception as e:
+            _logger.warning("图片磁盘缓存不可用: %s", e)
+    return _cover_cache
+
+
+def decode_scaled(data: bytes, size: Tuple[int, int]) -> Optional[Tuple[bytes, int, int, int]]:
+    """
+    Decode image bytes and downscale them to fit the given size.
+    
+    Args:
+        data: Encoded image bytes
+        size: Maximum (width, height)
+        
+    Returns:
+        Tuple of (RGB888 bytes, width, height, bytes per line), or None if decoding fails
+    """
+    if _TURBO_JPEG is not None and data[:2] == b'\xff\xd8':
+        decoded = _decode_scaled_turbo(data, size)
+        if decoded is not None:
+            return decoded
+    
+    try:
+        img = Image.open(BytesIO(data))
+        # JPEG: let libjpeg scale down during the DCT instead of after decode
+        img.draft('RGB', size)
+        img.thumbnail(size, Image.BILINEAR)
+        img = img.convert('RGB')
+        return img.tobytes(), img.width, img.height, img.width * 3
+    except Exception:
+        # Formats Pillow cannot handle, let Qt's image plugins try
+        return _decode_scaled_qt(data, size)
+
+
+def _decode_scaled_turbo(data: bytes, size: Tuple[int, int]) -> Optional[Tuple[bytes, int, int, int]]:
+    """
+    Decode JPEG bytes with libjpeg-turbo (PyTurboJPEG), scaling during the DCT.
+    
+    Args:
+        data: Encoded JPEG bytes
+        size: Maximum (width, height)
+        
+    Returns:
+        Same as `decode_scaled`
+    """
+    try:
+        width, height, _, _ = _TURBO_JPEG.decode_header(data)
+        # Smallest DCT downscaling factor that still covers the target size
+        factors = sorted((f for f in _TURBO_JPEG.scaling_factors if f[0] <= f[1]), key=lambda f: f[0] / f[1])
+        scaling_factor = next(
+            (f for f in factors
+             if width * f[0] // f[1] >= size[0] and height * f[0] // f[1] >= size[1]),
+            (1, 1)
+        )
+        
+        img = Image.fromarray(_TURBO_JPEG.decode(data, pixel_format=TJPF_RGB, scaling_factor=scaling_factor))
+        img.thumbnail(size, Image.BILINEAR)
+        return img.tobytes(), img.width, img.height, img.width * 3
+    except Exception:
+        return None
+
+
+def _image_format(data: bytes) -> Optional[str]:
+    """
+    Get the Qt image format name from the leading magic bytes.
+    
+    Passing it to the decoder skips Qt's probing of every installed image
+    plugin. Works for disk-cached bytes too, which have no Content-Type.
+    
+    Args:
+        data: Encoded image bytes
+    
+    Returns:
+        Format name such as "JPEG", or None to let Qt detect it
+    """
+    if data.startswith(b'\xff\xd8'):
+        return "JPEG"
+    if data.startswith(b'\x89PNG'):
+        return "PNG"
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return "WEBP"
+    if data.startswith(b'GIF8'):
+        return "GIF"
+    return None
+
+
+def _decode_scaled_qt(data: bytes, size: Tuple[int, int]) -> Optional[Tuple[bytes, int, int, int]]:
+    """
+    Decode image bytes with QImageReader, scaling during decode.
+    
+    QImage (unlike QPixmap) is safe to use outside the GUI thread.
+    
+    Args:
+        data: Encoded image bytes
+        size: Maximum (width, height)
+        
+    Returns:
+        Same as `decode_scaled`
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    
+    reader = QImageReader(buffer, (_image_format(data) or "").encode())
+    reader.setAutoTransform(True)
+    original = reader.size()
+    if original.isValid():
+        target = QSize(*size)
+        if original.width() > target.width() or original.height() > target.height():
+            reader.setScaledSize(original.scaled(target, Qt.KeepAspectRatio))
+    
+    img = reader.read()
+    if img.isNull():
+        return None
+    
+    img = img.convertToFormat(QImage.Format_RGB888)
+    return bytes(img.constBits()), img.width(), img.height(), img.bytesPerLine()
+
+
+def pixmap_from_rgb(decoded: Tuple[bytes, int, int, int], dpr: float = 1.0) -> QPixmap:
+    """Build a pixmap (GUI thread only) from a `decode_scaled` result."""
+    data, width, height, bytes_per_line = decoded
+    pixmap = QPixmap.fromImage(QImage(data, width, height, bytes_per_line, QImage.Format_RGB888))
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+class ImageSignals(QObject):
+    """Signals shared by the image download tasks of a page."""
+    
+    finished = Signal(str, object)  # url, (rgb bytes, width, height, bytes per line) or None on failure
+
+
+class ImageTask(QRunnable):
+    """Download and downscale a single image in the page's thread pool."""
+    
+    def __init__(self, url: str, size: Tuple[int, int], signals: ImageSignals,
+                 timeout: int = 8, disk_cache: Optional[CoverCache] = None):
+        """
+        Initialize image task.
+        
+        Args:
+            url: Image URL
+            size: Maximum (width, height) of the decoded image
+            signals: Shared signals object living on the GUI thread
+            timeout: Request timeout in seconds
+            disk_cache: Persistent cache consulted before the network
+        """
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.signals = signals
+        self.timeout = timeout
+        self.disk_cache = disk_cache
+    
+    @Slot()
+    def run(self):
+        """Download and decode the image, hand the scaled RGB buffer to the GUI thread."""
+        decoded = None
+        try:
+            data = self.disk_cache.get(self.url) if self.disk_cache else None
+            if data is not None:
+                decoded = decode_scaled(data, self.size)
+            
+            if decoded is None:
+                response = IMAGE_SESSION.get(self.url, timeout=self.timeout)
+                if response.status_code == 200:
+                    decoded = decode_scaled(response.content, self.size)
+                    if decoded is not None and self.disk_cache:
+                        self.disk_cache.put(self.url, response.content)
+                    elif decoded is None:
+                        _logger.warning("Failed to decode image from %s", self.url)
+                else:
+                    _logger.warning("Image HTTP %s for %s", response.status_code, self.url)
+        except Exception as e:
+            _logger.warning("Image load error for %s: %s", self.url, e)
+            decoded = None
+        
+        self.signals.finished.emit(self.url, decoded)
+
+
+class WarmUpTask(QRunnable):
+    """Open a keep-alive connection to an image server ahead of the first download."""
+    
+    def __init__(self, server: str):
+        """
+        Initialize warm-up task.
+        
+        Args:
+            server: Image server host
+        """
+        super().__init__()
+        self.server = server
+    
+    @Slot()
+    def run(self):
+        """Send a HEAD request so the TLS handshake is done before covers need it."""
+        try:
+            IMAGE_SESSION.head(f"https://{self.server}/", timeout=5)
+        except Exception:
+            pass